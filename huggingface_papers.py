@@ -19,6 +19,7 @@ Prerequisites:
 
 import argparse
 import json
+import mmap
 import os
 import re
 import sys
@@ -56,7 +57,46 @@ ARXIV_BASE = "https://arxiv.org"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) Learning-Library-Bot/1.0"
 }
-REQUEST_DELAY = 1.0  # Seconds between requests
+class TokenBucket:
+    """
+    Per-host rate limiter: allows short bursts up to `capacity` requests,
+    refilling at `rate` tokens per second. Unlike a fixed sleep, time spent
+    waiting on slow responses counts against the budget, so fast responses
+    don't pay an artificial delay.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def wait(self):
+        """Block until a request token is available, then consume it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.last_refill = time.monotonic()
+            self.tokens = 1.0
+
+        self.tokens -= 1
+
+
+# Rate limits: stay polite to each host without a hard sleep per request
+HF_BUCKET = TokenBucket(rate=5, capacity=5)      # huggingface.co: 5 req/s burst
+ARXIV_BUCKET = TokenBucket(rate=3, capacity=3)   # arxiv.org: 3 req/s burst
+
+# arXiv IDs are YYMM.NNNNN format (e.g., 2512.23959)
+_PAPER_HREF_RE = re.compile(r"/papers/(\d{4}\.\d+)")
+_NUMBER_RE = re.compile(r"^\d+$")
+
+# Byte-level markers for scanning metadata files without a full JSON parse
+# (json.dump with indent=2 always emits this exact key/value spacing)
+_PAPER_TYPE_BYTES = b'"content_type": "paper"'
+_ARXIV_ID_BYTES_RE = re.compile(rb'"arxiv_id":\s*"([^"]+)"')
 
 # LLM Prompts
 PAPER_SUMMARY_PROMPT = """Analyze this research paper and provide insights accessible to ML practitioners.
@@ -118,6 +158,12 @@ DESCRIPTION: <description>
 
 (continue for remaining sections)"""
 
+# Bound format_map methods: skips re-parsing the template string on every
+# call during bulk imports
+_SUMMARY_FMT = PAPER_SUMMARY_PROMPT.format_map
+_FACETS_FMT = PAPER_FACETS_PROMPT.format_map
+_SECTIONS_FMT = PAPER_SECTIONS_PROMPT.format_map
+
 
 def fetch_daily_papers(date: str = None) -> list:
     """
@@ -142,12 +188,13 @@ def fetch_daily_papers(date: str = None) -> list:
     for url in urls_to_try:
         print(f"Fetching papers from: {url}")
         try:
+            HF_BUCKET.wait()
             response = requests.get(url, headers=HEADERS, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
 
             # Check if we got papers
-            test_links = soup.find_all("a", href=re.compile(r"/papers/\d{4}\.\d+"))
+            test_links = soup.find_all("a", href=_PAPER_HREF_RE)
             if test_links:
                 print(f"Found {len(test_links)} paper links")
                 break
@@ -163,14 +210,16 @@ def fetch_daily_papers(date: str = None) -> list:
         return []
 
     papers = []
+    seen_ids = set()
 
-    # Find paper links - arXiv IDs are YYMM.NNNNN format (e.g., 2512.23959)
-    paper_links = soup.find_all("a", href=re.compile(r"/papers/\d{4}\.\d+"))
+    # Walk the paper cards top-down so each link/title/upvote lookup stays
+    # inside one article instead of re-walking parents per link
+    for art in soup.select("article"):
+        link = art.select_one('a[href^="/papers/"]')
+        if not link:
+            continue
 
-    seen_ids = set()
-    for link in paper_links:
-        href = link.get("href", "")
-        match = re.search(r"/papers/(\d{4}\.\d+)", href)
+        match = _PAPER_HREF_RE.search(link["href"])
         if not match:
             continue
 
@@ -181,16 +230,13 @@ def fetch_daily_papers(date: str = None) -> list:
         # Get title from link text (skip if it's an image-only link)
         title = link.get_text(strip=True)
 
-        # If this link has no text (probably an image link), look for a sibling/nearby h3 or title link
+        # If this link has no text (probably an image link), look for the title link in the h3
         if not title or len(title) < 10:
-            # Try to find the title in a nearby h3 element
-            parent = link.find_parent("article") or link.find_parent("div", class_=True)
-            if parent:
-                h3 = parent.find("h3")
-                if h3:
-                    title_link = h3.find("a", href=re.compile(rf"/papers/{arxiv_id}"))
-                    if title_link:
-                        title = title_link.get_text(strip=True)
+            h3 = art.find("h3")
+            if h3:
+                title_link = h3.find("a", href=_PAPER_HREF_RE)
+                if title_link:
+                    title = title_link.get_text(strip=True)
 
         if not title or len(title) < 10:
             continue
@@ -198,17 +244,15 @@ def fetch_daily_papers(date: str = None) -> list:
         seen_ids.add(arxiv_id)
 
         # Try to find upvotes in nearby elements
+        # Look for upvote count - typically a number near a heart/upvote icon
         upvotes = 0
-        parent = link.find_parent("article") or link.find_parent("div", class_=True)
-        if parent:
-            # Look for upvote count - typically a number near a heart/upvote icon
-            for elem in parent.find_all(string=re.compile(r"^\d+$")):
-                try:
-                    val = int(elem.strip())
-                    if val > upvotes and val < 10000:  # Reasonable upvote range
-                        upvotes = val
-                except ValueError:
-                    pass
+        for elem in art.find_all(string=_NUMBER_RE):
+            try:
+                val = int(elem.strip())
+                if val > upvotes and val < 10000:  # Reasonable upvote range
+                    upvotes = val
+            except ValueError:
+                pass
 
         papers.append({
             "arxiv_id": arxiv_id,
@@ -233,6 +277,7 @@ def fetch_paper_details(arxiv_id: str) -> dict:
     url = f"{HUGGINGFACE_PAPERS}/{arxiv_id}"
 
     try:
+        HF_BUCKET.wait()
         response = requests.get(url, headers=HEADERS, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
@@ -309,6 +354,7 @@ def fetch_arxiv_abstract(arxiv_id: str) -> str:
     url = f"{ARXIV_BASE}/abs/{arxiv_id}"
 
     try:
+        ARXIV_BUCKET.wait()
         response = requests.get(url, headers=HEADERS, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
@@ -352,6 +398,7 @@ def fetch_arxiv_pdf_text(arxiv_id: str, max_pages: int = 15) -> str:
     if not cache_path.exists():
         print(f"  Downloading PDF from arXiv...")
         try:
+            ARXIV_BUCKET.wait()
             response = requests.get(pdf_url, headers=HEADERS, timeout=60, stream=True)
             response.raise_for_status()
 
@@ -422,12 +469,12 @@ def analyze_paper(paper: dict, full_text: str = None) -> dict:
         # Include first ~3000 chars of full text
         full_text_section = f"\n\nFull Text Excerpt:\n{full_text[:3000]}..."
 
-    summary_prompt = PAPER_SUMMARY_PROMPT.format(
-        title=title,
-        authors=authors,
-        abstract=abstract,
-        full_text_section=full_text_section
-    )
+    summary_prompt = _SUMMARY_FMT({
+        "title": title,
+        "authors": authors,
+        "abstract": abstract,
+        "full_text_section": full_text_section,
+    })
 
     summary_response = llm.generate(summary_prompt, timeout=60)
 
@@ -450,10 +497,7 @@ def analyze_paper(paper: dict, full_text: str = None) -> dict:
 
     # Generate facets
     print("  Analyzing topics and difficulty...")
-    facets_prompt = PAPER_FACETS_PROMPT.format(
-        title=title,
-        abstract=abstract
-    )
+    facets_prompt = _FACETS_FMT({"title": title, "abstract": abstract})
 
     facets_response = llm.generate(facets_prompt, timeout=30)
 
@@ -493,9 +537,7 @@ def analyze_paper(paper: dict, full_text: str = None) -> dict:
     result["sections"] = []
     if full_text and len(full_text) > 2000:
         print("  Identifying key sections...")
-        sections_prompt = PAPER_SECTIONS_PROMPT.format(
-            text_excerpt=full_text[:6000]
-        )
+        sections_prompt = _SECTIONS_FMT({"text_excerpt": full_text[:6000]})
 
         sections_response = llm.generate(sections_prompt, timeout=45)
 
@@ -531,6 +573,13 @@ def sanitize_filename(title: str) -> str:
     return slug[:80]
 
 
+def _fmt_section(header: str, body: str) -> str:
+    """Format a markdown section, returning "" when the body is empty."""
+    if not body:
+        return ""
+    return f"## {header}\n\n{body}\n\n"
+
+
 def save_paper(paper: dict, analysis: dict) -> tuple:
     """
     Save paper metadata and markdown.
@@ -572,70 +621,77 @@ def save_paper(paper: dict, analysis: dict) -> tuple:
     with open(metadata_path, "w") as f:
         json.dump(metadata, f, indent=2)
 
-    # Build markdown
-    md_lines = [
-        f"# {metadata['title']}",
-        "",
-        f"**Authors:** {', '.join(metadata['authors'][:5])}{'...' if len(metadata['authors']) > 5 else ''}",
-        "",
-        f"**Source:** [HuggingFace]({metadata['huggingface_url']}) | [arXiv]({metadata['arxiv_url']})",
-        "",
-        f"**Published:** {metadata['published_date']}",
-        "",
-    ]
+    # Build markdown in one pass (optional sections collapse to "")
+    org_section = (
+        f"**Organization:** {metadata['organization']}\n\n"
+        if metadata.get("organization") else ""
+    )
+
+    summary_section = _fmt_section(
+        "Summary",
+        "\n".join(f"- {point}" for point in metadata.get("summary", []))
+    )
 
-    if metadata.get("organization"):
-        md_lines.extend([f"**Organization:** {metadata['organization']}", ""])
-
-    # Summary
-    if metadata.get("summary"):
-        md_lines.extend(["## Summary", ""])
-        for point in metadata["summary"]:
-            md_lines.append(f"- {point}")
-        md_lines.append("")
-
-    # Abstract
-    if metadata.get("abstract"):
-        md_lines.extend([
-            "## Abstract",
-            "",
-            metadata["abstract"],
-            ""
-        ])
-
-    # Sections
-    if metadata.get("sections"):
-        md_lines.extend(["## Key Sections", ""])
-        for sec in metadata["sections"]:
-            md_lines.append(f"- **{sec['title']}** - {sec['description']}")
-        md_lines.append("")
-
-    # Metadata footer
-    md_lines.extend([
-        "---",
-        "",
-        f"*Topics: {', '.join(metadata['facets'].get('topics', []))}*",
-        f"*Difficulty: {metadata['facets'].get('difficulty', 'unknown')}*",
-        f"*Upvotes: {metadata.get('upvotes', 0)}*",
-    ])
-
-    # Save markdown
+    abstract_section = _fmt_section("Abstract", metadata.get("abstract", ""))
+
+    sections_section = _fmt_section(
+        "Key Sections",
+        "\n".join(
+            f"- **{sec['title']}** - {sec['description']}"
+            for sec in metadata.get("sections", [])
+        )
+    )
+
+    md = (
+        f"# {metadata['title']}\n"
+        f"\n"
+        f"**Authors:** {', '.join(metadata['authors'][:5])}{'...' if len(metadata['authors']) > 5 else ''}\n"
+        f"\n"
+        f"**Source:** [HuggingFace]({metadata['huggingface_url']}) | [arXiv]({metadata['arxiv_url']})\n"
+        f"\n"
+        f"**Published:** {metadata['published_date']}\n"
+        f"\n"
+        f"{org_section}"
+        f"{summary_section}"
+        f"{abstract_section}"
+        f"{sections_section}"
+        f"---\n"
+        f"\n"
+        f"*Topics: {', '.join(metadata['facets'].get('topics', []))}*\n"
+        f"*Difficulty: {metadata['facets'].get('difficulty', 'unknown')}*\n"
+        f"*Upvotes: {metadata.get('upvotes', 0)}*"
+    )
+
+    # Save markdown with a single write
     markdown_path = PAPERS_DIR / f"{slug}.md"
-    with open(markdown_path, "w") as f:
-        f.write("\n".join(md_lines))
+    markdown_path.write_text(md)
 
     return metadata_path, markdown_path
 
 
 def get_existing_paper_ids() -> set:
-    """Get set of arXiv IDs already in the library."""
+    """
+    Get set of arXiv IDs already in the library.
+
+    Scans metadata files at the byte level (mmap + substring/regex) rather
+    than JSON-parsing every file just to read two fields; falls back to a
+    full json.load only when the cheap checks are inconclusive.
+    """
     ids = set()
     for json_file in METADATA_DIR.glob("*.json"):
         try:
-            with open(json_file) as f:
-                data = json.load(f)
-                if data.get("content_type") == "paper":
-                    ids.add(data.get("arxiv_id") or data.get("id"))
+            with open(json_file, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _PAPER_TYPE_BYTES not in mm:
+                    continue
+                match = _ARXIV_ID_BYTES_RE.search(mm)
+                if match:
+                    ids.add(match.group(1).decode())
+                    continue
+                # Marker present but no arxiv_id field - parse to be sure
+                data = json.loads(mm[:])
+            if data.get("content_type") == "paper":
+                ids.add(data.get("arxiv_id") or data.get("id"))
         except Exception:
             pass
     return ids
@@ -655,22 +711,30 @@ def import_paper(arxiv_id: str, paper_info: dict = None, fetch_full_text: bool =
     """
     print(f"\nImporting paper: {arxiv_id}")
 
-    # Fetch details if not provided
-    if not paper_info or not paper_info.get("abstract"):
+    if not paper_info:
+        paper_info = {
+            "arxiv_id": arxiv_id,
+            "huggingface_url": f"{HUGGINGFACE_BASE}/papers/{arxiv_id}",
+            "arxiv_url": f"{ARXIV_BASE}/abs/{arxiv_id}",
+        }
+
+    # arXiv's abstract page is smaller and more reliable than the full HF
+    # paper page, so it's the primary source for the abstract
+    if not paper_info.get("abstract"):
+        print("  Fetching abstract from arXiv...")
+        paper_info["abstract"] = fetch_arxiv_abstract(arxiv_id)
+
+    # Hit the HF paper page when any of its fields are missing: the
+    # daily-papers listing supplies a title but never authors or
+    # organization, so daily imports still need the detail fetch - only
+    # fully pre-populated paper_info dicts skip it
+    if not (paper_info.get("title") and paper_info.get("authors")
+            and paper_info.get("organization")):
         print("  Fetching paper details...")
         details = fetch_paper_details(arxiv_id)
-        time.sleep(REQUEST_DELAY)
-
-        if paper_info:
-            paper_info.update(details)
-        else:
-            paper_info = details
-
-        # Fallback to arXiv for abstract
-        if not paper_info.get("abstract"):
-            print("  Fetching abstract from arXiv...")
-            paper_info["abstract"] = fetch_arxiv_abstract(arxiv_id)
-            time.sleep(REQUEST_DELAY)
+        for key, value in details.items():
+            if value and not paper_info.get(key):
+                paper_info[key] = value
 
     if not paper_info.get("title"):
         print(f"  Error: Could not fetch paper details for {arxiv_id}")
@@ -680,7 +744,6 @@ def import_paper(arxiv_id: str, paper_info: dict = None, fetch_full_text: bool =
     full_text = ""
     if fetch_full_text:
         full_text = fetch_arxiv_pdf_text(arxiv_id)
-        time.sleep(REQUEST_DELAY)
 
     # Analyze with LLM
     print("  Analyzing paper with LLM...")
@@ -775,10 +838,6 @@ def import_daily_papers(
             print(f"  Error: {e}")
             failed += 1
 
-        # Delay between papers
-        if i < len(new_papers):
-            time.sleep(REQUEST_DELAY)
-
     print("\n" + "=" * 60)
     print(f"Import complete!")
     print(f"  Imported: {success}")
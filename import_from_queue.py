@@ -12,12 +12,17 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from youtube_transcript_to_md import (
     extract_video_id,
     fetch_transcript,
@@ -31,33 +36,84 @@ from youtube_transcript_to_md import (
 from library import generate_site
 
 QUEUE_FILE = BASE_DIR / "import_queue.json"
+DONE_LOG_FILE = BASE_DIR / "import_queue.done.jsonl"
 PENDING_FILE = BASE_DIR / "pending.json"
 
 
+def _read_json(path):
+    """Parse a JSON file (orjson when available, ~2-5x faster)."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path, obj):
+    """Write an indented JSON file (orjson when available)."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+
 def load_queue():
-    """Load the import queue."""
+    """
+    Load the import queue.
+
+    Completed videos are recorded in an append-only done-log rather than
+    rewriting the whole queue file per video; any log left by a previous
+    (possibly crashed) run is folded into the snapshot here.
+    """
     if not QUEUE_FILE.exists():
         return {"videos": []}
     try:
-        with open(QUEUE_FILE) as f:
-            return json.load(f)
+        queue = _read_json(QUEUE_FILE)
     except Exception as e:
         print(f"Error loading queue: {e}")
         return {"videos": []}
 
+    done_ids = load_done_ids()
+    if done_ids:
+        queue["videos"] = [v for v in queue.get("videos", []) if v["id"] not in done_ids]
+        save_queue(queue)  # Compact: snapshot absorbs the done-log
+
+    return queue
+
 
 def save_queue(queue):
-    """Save the import queue."""
-    with open(QUEUE_FILE, "w") as f:
-        json.dump(queue, f, indent=2)
+    """Save the import queue snapshot and clear the done-log."""
+    _write_json(QUEUE_FILE, queue)
+    DONE_LOG_FILE.unlink(missing_ok=True)
+
+
+def load_done_ids():
+    """Read video IDs recorded in the append-only done-log."""
+    done_ids = set()
+    if DONE_LOG_FILE.exists():
+        try:
+            with open(DONE_LOG_FILE) as f:
+                loads = orjson.loads if orjson is not None else json.loads
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        done_ids.add(loads(line)["id"])
+        except Exception as e:
+            print(f"Error reading done-log: {e}")
+    return done_ids
+
+
+def mark_done(done_log, video_id, status):
+    """Append one completed video to the done-log (a single short write)."""
+    done_log.write(json.dumps({"id": video_id, "status": status}) + "\n")
+    done_log.flush()
 
 
 def load_pending():
     """Load pending.json."""
     if PENDING_FILE.exists():
         try:
-            with open(PENDING_FILE) as f:
-                return json.load(f)
+            return _read_json(PENDING_FILE)
         except Exception:
             pass
     return {"failed": []}
@@ -65,8 +121,7 @@ def load_pending():
 
 def save_pending(data):
     """Save pending.json."""
-    with open(PENDING_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_json(PENDING_FILE, data)
 
 
 def add_to_pending(video, error):
@@ -121,8 +176,7 @@ def process_video(video):
 
         write_markdown(transcript, metadata, transcript_path)
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
 
         return True, metadata["title"]
 
@@ -130,11 +184,44 @@ def process_video(video):
         return False, str(e)
 
 
+async def process_video_async(video, sem, delay):
+    """
+    Process one video under a concurrency semaphore.
+
+    The pipeline (transcript fetch + LLM analysis) is I/O-bound, so videos
+    are overlapped in worker threads; the semaphore caps in-flight videos
+    and the delay is paid inside the slot to pace per-worker requests.
+    """
+    async with sem:
+        success, result = await asyncio.to_thread(process_video, video)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    return video, success, result
+
+
+async def process_queue_async(videos, workers, delay, on_done):
+    """Run the import pipeline over the queue with bounded concurrency.
+
+    on_done(video, success, result) fires in completion order as each
+    video finishes - not after the whole batch - so the done-log stays
+    durable even when a run crashes or is interrupted midway.
+    """
+    sem = asyncio.Semaphore(workers)
+    tasks = [
+        asyncio.create_task(process_video_async(video, sem, delay))
+        for video in videos
+    ]
+    for future in asyncio.as_completed(tasks):
+        video, success, result = await future
+        on_done(video, success, result)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process import queue")
     parser.add_argument("--limit", type=int, help="Max videos to process")
     parser.add_argument("--dry-run", action="store_true", help="Preview only")
     parser.add_argument("--delay", type=float, default=2.0, help="Delay between imports")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent imports")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -164,30 +251,38 @@ def main():
             print(f"    URL: {video['url']}")
         return
 
-    # Process videos
+    # Process videos concurrently; queue/pending updates stay in this thread
     success_count = 0
     fail_count = 0
 
-    for i, video in enumerate(videos, 1):
-        print(f"\n[{i}/{len(videos)}] {video['title'][:50]}...")
-
-        success, result = process_video(video)
+    print(f"Processing with {args.workers} workers...\n")
+    done_count = 0
+
+    with open(DONE_LOG_FILE, "a") as done_log:
+        def on_done(video, success, result):
+            # Runs on the event-loop thread as each video completes, so
+            # the done-log records progress video by video and a crash
+            # mid-run never re-imports finished videos
+            nonlocal success_count, fail_count, done_count, queue
+            done_count += 1
+            print(f"[{done_count}/{len(videos)}] {video['title'][:50]}...")
+
+            if success:
+                print(f"  ✓ Imported: {result}")
+                success_count += 1
+            else:
+                print(f"  ✗ Failed: {result}")
+                add_to_pending(video, result)
+                fail_count += 1
 
-        if success:
-            print(f"  ✓ Imported: {result}")
             queue = remove_from_queue(video["id"], queue)
-            save_queue(queue)
-            success_count += 1
-        else:
-            print(f"  ✗ Failed: {result}")
-            add_to_pending(video, result)
-            queue = remove_from_queue(video["id"], queue)
-            save_queue(queue)
-            fail_count += 1
+            mark_done(done_log, video["id"], "ok" if success else "failed")
+
+        asyncio.run(process_queue_async(videos, args.workers, args.delay,
+                                        on_done))
 
-        # Delay between imports
-        if i < len(videos):
-            time.sleep(args.delay)
+    # Compact once at the end instead of rewriting the queue per video
+    save_queue(queue)
 
     print("\n" + "=" * 60)
     print(f"Import complete!")
@@ -12,12 +12,34 @@ Requires:
     pip install jinja2
 """
 
+import functools
+import gzip
+import hashlib
+import io
 import json
+import os
 import shutil
-from collections import defaultdict
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+try:
+    import orjson  # Optional: much faster JSON parse/serialize
+except ImportError:
+    orjson = None
+
+try:
+    import rcssmin  # Optional: CSS minification
+except ImportError:
+    rcssmin = None
+
+try:
+    import brotli  # Optional: better-than-gzip precompression
+except ImportError:
+    brotli = None
 
 BASE_DIR = Path(__file__).parent
 METADATA_DIR = BASE_DIR / "metadata"
@@ -28,18 +50,102 @@ BLOGS_DIR = BASE_DIR / "blogs"
 TEMPLATES_DIR = BASE_DIR / "templates"
 SITE_DIR = BASE_DIR / "site"
 
+# Input mtimes from the previous build, used to skip unchanged entry pages
+BUILD_CACHE_FILE = BASE_DIR / ".build-cache.json"
+
+
+def _write_bytes(path, data: bytes):
+    """Write a complete byte buffer through a raw fd.
+
+    Skips the buffered file object and text-encoding layers that
+    Path.write_text sets up per call - the buffer is already encoded,
+    so one open/write/close is all that's needed.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_if_changed(path, data: bytes) -> bool:
+    """Write data unless the file already holds identical bytes.
+
+    Skipping no-op writes preserves output mtimes, which is what
+    rsync/CDN incremental deploys key on - a rebuild that changes
+    nothing should upload nothing. The size check makes the common
+    changed case cheap; the full compare only runs on a size match.
+    """
+    try:
+        if os.path.getsize(path) == len(data) and Path(path).read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    _write_bytes(path, data)
+    return True
+
+
+def _read_json(path: Path) -> dict:
+    """Parse a JSON file, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write compact JSON, preferring orjson when installed.
+
+    library.json and the build cache are consumed programmatically, so
+    no indentation: pretty-printing tripled the output size and the
+    serializer work for no reader's benefit.
+    """
+    if orjson is not None:
+        _write_if_changed(path, orjson.dumps(data))
+    else:
+        # 1MB buffer: json.dump emits many small chunks, and the default
+        # 8KB text buffer turns a large library.json into hundreds of
+        # write syscalls
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def _load_one(json_file: Path):
+    """Load a single metadata file, or None if it can't be parsed."""
+    try:
+        data = _read_json(json_file)
+        data["_filename"] = json_file.stem
+        data["slug"] = json_file.stem  # Used by templates for page links
+
+        # Normalize facets once so downstream loops can index directly
+        # instead of chaining .get() fallbacks per entry
+        facets = data.setdefault("facets", {})
+        facets.setdefault("topics", [])
+        facets.setdefault("format", "other")
+        facets.setdefault("difficulty", "intermediate")
+        return data
+    except Exception as e:
+        print(f"Warning: Could not load {json_file}: {e}")
+        return None
+
 
 def load_library() -> list:
     """Load all metadata files and return sorted list."""
-    entries = []
-    for json_file in METADATA_DIR.glob("*.json"):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-                data["_filename"] = json_file.stem
-                entries.append(data)
-        except Exception as e:
-            print(f"Warning: Could not load {json_file}: {e}")
+    # os.scandir + suffix check instead of glob: one directory read, no
+    # per-name fnmatch
+    with os.scandir(METADATA_DIR) as it:
+        files = [Path(f.path) for f in it if f.name.endswith(".json")]
+
+    # Loading is dominated by open/read syscalls on many small files, so
+    # overlap them in a thread pool (orjson also releases the GIL while
+    # parsing, so parse CPU overlaps too)
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            loaded = executor.map(_load_one, files)
+    else:
+        loaded = map(_load_one, files)
+
+    entries = [data for data in loaded if data is not None]
 
     # Sort by date added, newest first
     entries.sort(key=lambda x: x.get("added_date", ""), reverse=True)
@@ -49,9 +155,45 @@ def load_library() -> list:
         if "domain" not in entry:
             entry["domain"] = infer_domain(entry)
 
+    _dedupe_entry_strings(entries)
     return entries
 
 
+def _dedupe_entry_strings(entries: list) -> None:
+    """Intern low-cardinality strings and share nested source dicts.
+
+    Every entry arrives from JSON with its own copies of the same facet
+    values and the same channel/show/blog info. Interning makes the
+    repeated strings pointer-equal (cheaper dict hashing in the index
+    builders, one copy in memory), and entries with the same source
+    slug share a single info dict - the site already treats the first
+    entry's info as canonical per slug when building channel pages.
+    """
+    intern = sys.intern
+    shared = {"channel": {}, "show": {}, "blog": {}}
+    for entry in entries:
+        content_type = entry.get("content_type")
+        if isinstance(content_type, str):
+            entry["content_type"] = intern(content_type)
+        entry["domain"] = intern(entry["domain"])
+
+        facets = entry["facets"]
+        facets["topics"] = [intern(t) if isinstance(t, str) else t
+                            for t in facets["topics"]]
+        if isinstance(facets["format"], str):
+            facets["format"] = intern(facets["format"])
+        if isinstance(facets["difficulty"], str):
+            facets["difficulty"] = intern(facets["difficulty"])
+
+        for key, cache in shared.items():
+            info = entry.get(key)
+            if isinstance(info, dict):
+                slug = info.get("slug")
+                if isinstance(slug, str):
+                    info["slug"] = intern(slug)
+                    entry[key] = cache.setdefault(slug, info)
+
+
 def infer_domain(metadata: dict) -> str:
     """
     Infer domain from metadata for backward compatibility.
@@ -74,85 +216,91 @@ def infer_domain(metadata: dict) -> str:
     return "computer-science"
 
 
-def build_facet_index(entries: list) -> dict:
-    """Build index of entries by facet values."""
-    index = {
-        "topics": defaultdict(list),
-        "format": defaultdict(list),
-        "difficulty": defaultdict(list)
-    }
-
-    for entry in entries:
-        facets = entry.get("facets", {})
-
-        for topic in facets.get("topics", []):
-            index["topics"][topic].append(entry)
-
-        fmt = facets.get("format", "other")
-        index["format"][fmt].append(entry)
-
-        diff = facets.get("difficulty", "intermediate")
-        index["difficulty"][diff].append(entry)
+# First-character bucket table for the A-Z index: ASCII letters map to
+# their lowercase form, everything else falls through to the "0-9" page
+_ALPHA_BUCKET = {c: chr(c | 0x20) for c in range(128) if chr(c).isalpha()}
 
-    return index
 
+def build_all_indices(entries: list) -> tuple:
+    """Build every per-entry index in a single pass.
 
-def build_channel_index(entries: list) -> dict:
-    """Build index of entries by channel."""
-    channels = defaultdict(list)
-    for entry in entries:
-        channel = entry.get("channel", {})
-        channel_slug = channel.get("slug", "unknown-channel")
-        channels[channel_slug].append(entry)
-    return channels
-
+    Returns (facet_index, channel_index, alpha_index, content_type_index,
+    show_index, blog_source_index, paper_topics). One fused loop touches
+    each entry dict once instead of six separate traversals; the paper
+    topic set and paper slugs ride along in the same pass so the papers
+    index doesn't need extra scans later.
+    """
+    # Plain dicts with setdefault rather than defaultdict(list): misses
+    # skip the __missing__ callback, and the finished indices can't
+    # silently grow keys when templates probe them
+    topic_index = {}
+    format_index = {}
+    difficulty_index = {}
+    facet_index = {
+        "topics": topic_index,
+        "format": format_index,
+        "difficulty": difficulty_index
+    }
+    channel_index = {}
+    alpha_index = {}
+    content_type_index = {"video": [], "paper": [], "podcast": [], "blog": [], "course": [], "legal": [], "law-journal": []}
+    show_index = {}
+    blog_source_index = {}
+    paper_topics = set()
 
-def build_alpha_index(entries: list) -> dict:
-    """Build index of entries by first letter of title."""
-    alpha = defaultdict(list)
     for entry in entries:
+        # Facets (normalized at load time, so direct indexing is safe)
+        facets = entry["facets"]
+        for topic in facets["topics"]:
+            topic_index.setdefault(topic, []).append(entry)
+        format_index.setdefault(facets["format"], []).append(entry)
+        difficulty_index.setdefault(facets["difficulty"], []).append(entry)
+
+        # Channel
+        channel_slug = entry.get("channel", {}).get("slug", "unknown-channel")
+        channel_index.setdefault(channel_slug, []).append(entry)
+
+        # First letter of title (table lookup, no per-entry .lower()/
+        # .isalpha() calls), decorated with the lowercase title so the
+        # A-Z pages can sort on a precomputed key
         title = entry.get("title", "")
         if title:
-            first_char = title[0].lower()
-            if first_char.isalpha():
-                alpha[first_char].append(entry)
-            else:
-                alpha["0-9"].append(entry)
-    return alpha
+            bucket = _ALPHA_BUCKET.get(ord(title[0]), "0-9")
+            alpha_index.setdefault(bucket, []).append((title.lower(), entry))
 
-
-def build_content_type_index(entries: list) -> dict:
-    """Build index of entries by content type (video/paper/podcast/blog/course/legal/law-journal)."""
-    index = {"video": [], "paper": [], "podcast": [], "blog": [], "course": [], "legal": [], "law-journal": []}
-    for entry in entries:
+        # Content type (unknown types default to video)
         content_type = entry.get("content_type", "video")
-        if content_type in index:
-            index[content_type].append(entry)
-        else:
-            index["video"].append(entry)  # Default to video
-    return index
-
+        if content_type not in content_type_index:
+            content_type = "video"
+        content_type_index[content_type].append(entry)
+
+        # Podcast shows, blog sources, and paper extras
+        if content_type == "podcast":
+            show_slug = entry.get("show", {}).get("slug", "unknown-show")
+            show_index.setdefault(show_slug, []).append(entry)
+        elif content_type == "blog":
+            blog_slug = entry.get("blog", {}).get("slug", "unknown-blog")
+            blog_source_index.setdefault(blog_slug, []).append(entry)
+        elif content_type == "paper":
+            paper_topics.update(facets["topics"])
 
-def build_show_index(entries: list) -> dict:
-    """Build index of podcast entries by show."""
-    shows = defaultdict(list)
-    for entry in entries:
-        if entry.get("content_type") == "podcast":
-            show = entry.get("show", {})
-            show_slug = show.get("slug", "unknown-show")
-            shows[show_slug].append(entry)
-    return shows
+    return (facet_index, channel_index, alpha_index, content_type_index,
+            show_index, blog_source_index, paper_topics)
 
 
-def build_blog_source_index(entries: list) -> dict:
-    """Build index of blog entries by source."""
-    sources = defaultdict(list)
-    for entry in entries:
-        if entry.get("content_type") == "blog":
-            blog = entry.get("blog", {})
-            blog_slug = blog.get("slug", "unknown-blog")
-            sources[blog_slug].append(entry)
-    return sources
+@functools.lru_cache(maxsize=4096)
+def _format_duration_int(seconds: int) -> str:
+    """Format a validated integer duration (cached: the same entries
+    appear on many index/topic/letter/channel pages)."""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        mins = seconds // 60
+        return f"{mins}m"
+    else:
+        hours = seconds // 3600
+        mins = (seconds % 3600) // 60
+        return f"{hours}h {mins}m"
 
 
 def format_duration(seconds) -> str:
@@ -163,16 +311,187 @@ def format_duration(seconds) -> str:
         seconds = int(seconds)
     except (ValueError, TypeError):
         return ""
+    return _format_duration_int(seconds)
 
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        mins = seconds // 60
-        return f"{mins}m"
+
+def _write_page(template, path, **context):
+    """Render a template and write it only if the output changed.
+
+    template.stream().dump() collects chunks as Jinja produces them
+    (no single giant join), then _write_if_changed skips the disk write
+    when the page is byte-identical to the last build - e.g. a template
+    edit that forces a full rebuild but only actually alters some
+    pages. Unchanged pages keep their mtimes, so deploy syncs upload
+    only real changes.
+    """
+    buf = io.BytesIO()
+    template.stream(**context).dump(buf, encoding="utf-8")
+    _write_if_changed(path, buf.getvalue())
+
+
+def _make_env() -> Environment:
+    """Build a Jinja environment with the library's filters registered.
+
+    auto_reload=False skips the per-get_template() mtime check (templates
+    don't change mid-build) and cache_size=-1 keeps every compiled template
+    resident, so repeated lookups in the render loops are plain dict hits.
+    The bytecode cache persists compiled templates across runs and across
+    the render worker processes, which otherwise each repeat parse+compile.
+    """
+    cache_dir = BASE_DIR / ".jinja_cache"
+    cache_dir.mkdir(exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        auto_reload=False,
+        cache_size=-1,
+        # The .j2 text templates (robots.txt, llms.txt) should keep their
+        # final newline like any other text file
+        keep_trailing_newline=True,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir))
+    )
+    env.filters["format_duration"] = format_duration
+    return env
+
+
+# Per-process Jinja environment for render workers. Environments are not
+# picklable, so each worker builds its own via the pool initializer.
+# _worker_templates memoizes resolved Template objects by name so the hot
+# per-page path skips Environment.get_template dispatch entirely and calls
+# the template's compiled render function directly.
+_worker_env = None
+_worker_templates = {}
+
+
+def _init_render_worker():
+    global _worker_env
+    _worker_env = _make_env()
+
+
+@functools.lru_cache(maxsize=256)
+def _read_md(path: str) -> str:
+    """Read an entry's markdown, cached per process.
+
+    Entries can point at the same underlying markdown (e.g. course units
+    sharing a file); the cache turns repeat reads into dict hits.
+    """
+    try:
+        return Path(path).read_text()
+    except FileNotFoundError:
+        return ""
+
+
+def _worker_template(env, name):
+    template = _worker_templates.get(name)
+    if template is None:
+        template = _worker_templates[name] = env.get_template(name)
+    return template
+
+
+def render_entry(task):
+    """Render one entry page (runs in a worker process).
+
+    task is (template_name, entry, md_path, out_path, context) with paths
+    as strings so the tuple pickles cheaply. Returns an error message for
+    the master process to report, or None on success.
+    """
+    template_name, entry, md_path, out_path, context = task
+    env = _worker_env if _worker_env is not None else _make_env()
+    try:
+        # md_path is None when the master's directory pre-scan found no
+        # markdown for this entry, so no exists() check is needed here
+        md_content = _read_md(md_path) if md_path else ""
+
+        template = _worker_template(env, template_name)
+        _write_page(template, out_path, entry=entry,
+                    markdown_content=md_content, **context)
+        return None
+    except Exception as e:
+        return f"Could not generate {out_path}: {e}"
+
+
+def _load_build_cache() -> dict:
+    """Load the previous build's input mtimes (empty on first build)."""
+    if BUILD_CACHE_FILE.exists():
+        try:
+            return _read_json(BUILD_CACHE_FILE)
+        except Exception:
+            pass
+    return {}
+
+
+def _mtime(path) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _filter_unchanged(render_tasks: list, build_cache: dict, new_cache: dict,
+                      templates_mtime: float, context_sig: str) -> list:
+    """Drop entry-page tasks whose inputs haven't changed since last build.
+
+    A page's signature is (metadata mtime, markdown mtime, newest template
+    mtime, shared-context hash); if it matches the cached signature and the
+    output HTML exists, the render is skipped. All signatures are recorded
+    in new_cache for the next run. context_sig covers everything baked into
+    every page besides the entry itself - the footer counts, CSS filenames,
+    critical CSS - so adding an entry (which changes the counts on all
+    pages) correctly invalidates pages whose own files are untouched.
+    """
+    kept = []
+    for task in render_tasks:
+        _template_name, entry, md_path, out_path, _context = task
+        signature = [
+            _mtime(METADATA_DIR / f"{entry['_filename']}.json"),
+            _mtime(md_path) if md_path else 0.0,
+            templates_mtime,
+            context_sig
+        ]
+        new_cache[out_path] = signature
+        if build_cache.get(out_path) == signature and os.path.exists(out_path):
+            continue
+        kept.append(task)
+    return kept
+
+
+def _md_path(directory: Path, stems: set, stem: str):
+    """Path string for an entry's markdown, or None if it doesn't exist.
+
+    Each content directory is scanned once with _scan_md_stems(); checking
+    membership here replaces a per-entry exists() syscall in the loops.
+    """
+    return str(directory / f"{stem}.md") if stem in stems else None
+
+
+def _scan_md_stems(directory: Path) -> set:
+    """Scan a content directory once and return the set of markdown stems."""
+    if not directory.is_dir():
+        return set()
+    with os.scandir(directory) as it:
+        return {e.name[:-3] for e in it if e.name.endswith(".md")}
+
+
+def render_entry_pages(render_tasks: list):
+    """Render entry pages across all CPU cores.
+
+    Jinja rendering is CPU-bound pure Python, so the per-entry pages
+    (the bulk of the site) fan out to a process pool; index pages stay
+    in the master process since there are only a handful of them.
+    """
+    if not render_tasks:
+        return
+
+    print(f"Rendering {len(render_tasks)} entry pages...")
+    if len(render_tasks) == 1:
+        results = map(render_entry, render_tasks)
     else:
-        hours = seconds // 3600
-        mins = (seconds % 3600) // 60
-        return f"{hours}h {mins}m"
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_init_render_worker) as executor:
+            results = list(executor.map(render_entry, render_tasks, chunksize=32))
+
+    for error in results:
+        if error:
+            print(f"  Warning: {error}")
 
 
 def generate_site():
@@ -186,12 +505,8 @@ def generate_site():
 
     print(f"Found {len(entries)} entries")
 
-    facet_index = build_facet_index(entries)
-    channel_index = build_channel_index(entries)
-    alpha_index = build_alpha_index(entries)
-    content_type_index = build_content_type_index(entries)
-    show_index = build_show_index(entries)
-    blog_source_index = build_blog_source_index(entries)
+    (facet_index, channel_index, alpha_index, content_type_index,
+     show_index, blog_source_index, paper_topics) = build_all_indices(entries)
 
     video_count = len(content_type_index["video"])
     paper_count = len(content_type_index["paper"])
@@ -202,25 +517,50 @@ def generate_site():
     journal_count = len(content_type_index["law-journal"])
     print(f"  Videos: {video_count}, Papers: {paper_count}, Podcasts: {podcast_count}, Blogs: {blog_count}, Courses: {course_count}, Legal: {legal_count}, Journals: {journal_count}")
 
-    # Set up Jinja environment
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
-    env.filters["format_duration"] = format_duration
+    # One shared context reused by every render below instead of
+    # rebuilding the same keyword dict per page: footer counts plus the
+    # critical CSS that base.html inlines for fast first paint
+    counts = {
+        "video_count": video_count,
+        "paper_count": paper_count,
+        "podcast_count": podcast_count,
+        "blog_count": blog_count,
+        "course_count": course_count,
+        "legal_count": legal_count,
+        "journal_count": journal_count,
+        "critical_css": _critical_css(),
+        # Hashed filenames only - the CSS bytes themselves stay out of
+        # the context so worker task tuples pickle cheaply
+        "css_file": next(a["file"] for a in _css_assets()
+                         if a["media"] is None),
+        "media_css": [{"media": a["media"], "file": a["file"]}
+                      for a in _css_assets() if a["media"]]
+    }
 
-    # Clear and recreate site directory
-    if SITE_DIR.exists():
-        shutil.rmtree(SITE_DIR)
-    SITE_DIR.mkdir()
-    (SITE_DIR / "topics").mkdir()
-    (SITE_DIR / "transcripts").mkdir()
-    (SITE_DIR / "papers").mkdir()
-    (SITE_DIR / "podcasts").mkdir()
-    (SITE_DIR / "shows").mkdir()
-    (SITE_DIR / "blogs").mkdir()
-    (SITE_DIR / "courses").mkdir()
-    (SITE_DIR / "legal").mkdir()
-    (SITE_DIR / "channels").mkdir()
-    (SITE_DIR / "browse").mkdir()
-    (SITE_DIR / "assets").mkdir()
+    # Set up Jinja environment (master process: index pages only)
+    env = _make_env()
+
+    # Per-entry pages are collected here and rendered in parallel at the end
+    render_tasks = []
+
+    # Create the site tree if missing. Entry pages are rebuilt
+    # incrementally against .build-cache.json; index pages (cheap, few,
+    # dependent on the full entry set) are always rewritten.
+    SITE_DIR.mkdir(exist_ok=True)
+    for subdir in ("topics", "transcripts", "papers", "podcasts", "shows",
+                   "blogs", "courses", "legal", "channels", "browse", "assets"):
+        (SITE_DIR / subdir).mkdir(exist_ok=True)
+
+    build_cache = _load_build_cache()
+    new_cache = {}
+    # style.css counts as a template input too: its critical section is
+    # inlined into every page, so edits must invalidate cached pages
+    with os.scandir(TEMPLATES_DIR) as it:
+        templates_mtime = max(
+            (e.stat().st_mtime for e in it
+             if e.name.endswith(".html") or e.name == "style.css"),
+            default=0.0
+        )
 
     # Build channels list for templates
     channels_list = []
@@ -238,42 +578,40 @@ def generate_site():
     # Generate index page
     print("Generating index page...")
     index_template = env.get_template("index.html")
-    index_html = index_template.render(
+    _write_page(
+        index_template, SITE_DIR / "index.html",
         entries=entries,
         facet_index=facet_index,
         topics=sorted(facet_index["topics"].keys()),
         formats=sorted(facet_index["format"].keys()),
         difficulties=["beginner", "intermediate", "advanced"],
         channels=channels_list[:10],
-        video_count=video_count,
-        paper_count=paper_count,
-        podcast_count=podcast_count,
-        blog_count=blog_count,
-        course_count=course_count,
-        total_entries=len(entries)
+        total_entries=len(entries),
+        **counts
     )
-    (SITE_DIR / "index.html").write_text(index_html)
 
     # Generate topic pages
     print("Generating topic pages...")
     topic_template = env.get_template("topic.html")
     for topic, topic_entries in facet_index["topics"].items():
-        topic_html = topic_template.render(
+        _write_page(
+            topic_template, SITE_DIR / "topics" / f"{topic}.html",
             topic=topic,
             entries=topic_entries,
-            total_entries=len(entries)
+            total_entries=len(entries),
+            **counts
         )
-        (SITE_DIR / "topics" / f"{topic}.html").write_text(topic_html)
 
     # Generate channel index page
     print("Generating channel pages...")
     try:
         channels_index_template = env.get_template("channels_index.html")
-        channels_index_html = channels_index_template.render(
+        _write_page(
+            channels_index_template, SITE_DIR / "channels" / "index.html",
             channels=channels_list,
-            entries=entries
+            entries=entries,
+            **counts
         )
-        (SITE_DIR / "channels" / "index.html").write_text(channels_index_html)
     except Exception as e:
         print(f"  Warning: Could not generate channels index: {e}")
 
@@ -282,13 +620,14 @@ def generate_site():
         channel_template = env.get_template("channel.html")
         for slug, channel_entries in channel_index.items():
             channel_info = channel_entries[0].get("channel", {}) if channel_entries else {}
-            channel_html = channel_template.render(
+            _write_page(
+                channel_template, SITE_DIR / "channels" / f"{slug}.html",
                 channel_name=channel_info.get("name", slug),
                 channel_url=channel_info.get("url", ""),
                 entries=channel_entries,
-                total_entries=len(entries)
+                total_entries=len(entries),
+                **counts
             )
-            (SITE_DIR / "channels" / f"{slug}.html").write_text(channel_html)
     except Exception as e:
         print(f"  Warning: Could not generate channel pages: {e}")
 
@@ -298,86 +637,57 @@ def generate_site():
     try:
         letter_template = env.get_template("letter.html")
         for letter in alphabet:
-            letter_entries = alpha_index.get(letter, [])
-            # Sort alphabetically within each letter
-            letter_entries.sort(key=lambda x: x.get("title", "").lower())
+            decorated = alpha_index.get(letter, [])
+            # Sort alphabetically on the precomputed lowercase title
+            decorated.sort(key=itemgetter(0))
 
-            letter_html = letter_template.render(
+            _write_page(
+                letter_template, SITE_DIR / "browse" / f"{letter}.html",
                 letter=letter,
                 alphabet=alphabet,
-                entries=letter_entries,
-                total_entries=len(entries)
+                entries=[entry for _, entry in decorated],
+                total_entries=len(entries),
+                **counts
             )
-            (SITE_DIR / "browse" / f"{letter}.html").write_text(letter_html)
     except Exception as e:
         print(f"  Warning: Could not generate A-Z pages: {e}")
 
-    # Generate transcript pages (videos only)
-    print("Generating transcript pages...")
-    transcript_template = env.get_template("transcript.html")
+    # Queue transcript pages (videos only)
+    print("Queueing transcript pages...")
+    transcript_stems = _scan_md_stems(TRANSCRIPTS_DIR)
     for entry in content_type_index["video"]:
-        # Read the markdown content
-        md_file = TRANSCRIPTS_DIR / f"{entry['_filename']}.md"
-        if md_file.exists():
-            md_content = md_file.read_text()
-        else:
-            md_content = ""
-
-        transcript_html = transcript_template.render(
-            entry=entry,
-            markdown_content=md_content,
-            video_count=video_count,
-            paper_count=paper_count
-        )
-        (SITE_DIR / "transcripts" / f"{entry['_filename']}.html").write_text(transcript_html)
+        render_tasks.append((
+            "transcript.html",
+            entry,
+            _md_path(TRANSCRIPTS_DIR, transcript_stems, entry["_filename"]),
+            str(SITE_DIR / "transcripts" / f"{entry['_filename']}.html"),
+            counts
+        ))
 
     # Generate paper pages
     if paper_count > 0:
-        print("Generating paper pages...")
+        print("Queueing paper pages...")
+        paper_stems = _scan_md_stems(PAPERS_DIR)
         try:
-            paper_template = env.get_template("paper.html")
             for entry in content_type_index["paper"]:
-                # Add slug for linking
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = PAPERS_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                paper_html = paper_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count
-                )
-                (SITE_DIR / "papers" / f"{entry['_filename']}.html").write_text(paper_html)
-
-            # Generate papers index page
+                render_tasks.append((
+                    "paper.html",
+                    entry,
+                    _md_path(PAPERS_DIR, paper_stems, entry["_filename"]),
+                    str(SITE_DIR / "papers" / f"{entry['_filename']}.html"),
+                    counts
+                ))
+
+            # Generate papers index page (slugs and topics were precomputed
+            # by build_all_indices)
             print("Generating papers index...")
             papers_index_template = env.get_template("papers_index.html")
-
-            # Get paper-specific topics
-            paper_topics = set()
-            for entry in content_type_index["paper"]:
-                for topic in entry.get("facets", {}).get("topics", []):
-                    paper_topics.add(topic)
-
-            # Add slug to each paper entry
-            papers_with_slugs = []
-            for entry in content_type_index["paper"]:
-                entry["slug"] = entry["_filename"]
-                papers_with_slugs.append(entry)
-
-            papers_index_html = papers_index_template.render(
-                entries=papers_with_slugs,
+            _write_page(
+                papers_index_template, SITE_DIR / "papers" / "index.html",
+                entries=content_type_index["paper"],
                 topics=sorted(paper_topics),
-                video_count=video_count,
-                paper_count=paper_count
+                **counts
             )
-            (SITE_DIR / "papers" / "index.html").write_text(papers_index_html)
 
         except Exception as e:
             print(f"  Warning: Could not generate paper pages: {e}")
@@ -392,124 +702,80 @@ def generate_site():
 
     # Generate podcast pages
     if podcast_count > 0:
-        print("Generating podcast pages...")
+        print("Queueing podcast pages...")
+        podcast_stems = _scan_md_stems(PODCASTS_DIR)
         try:
-            podcast_template = env.get_template("podcast.html")
             for entry in content_type_index["podcast"]:
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = PODCASTS_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                podcast_html = podcast_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count
-                )
-                (SITE_DIR / "podcasts" / f"{entry['_filename']}.html").write_text(podcast_html)
+                render_tasks.append((
+                    "podcast.html",
+                    entry,
+                    _md_path(PODCASTS_DIR, podcast_stems, entry["_filename"]),
+                    str(SITE_DIR / "podcasts" / f"{entry['_filename']}.html"),
+                    counts
+                ))
 
             # Generate podcasts index page
             print("Generating podcasts index...")
             podcasts_index_template = env.get_template("podcasts_index.html")
-            podcasts_index_html = podcasts_index_template.render(
+            _write_page(
+                podcasts_index_template, SITE_DIR / "podcasts" / "index.html",
                 entries=content_type_index["podcast"],
-                video_count=video_count,
-                paper_count=paper_count,
-                podcast_count=podcast_count,
-                blog_count=blog_count
+                **counts
             )
-            (SITE_DIR / "podcasts" / "index.html").write_text(podcasts_index_html)
 
         except Exception as e:
             print(f"  Warning: Could not generate podcast pages: {e}")
 
     # Generate blog pages
     if blog_count > 0:
-        print("Generating blog pages...")
+        print("Queueing blog pages...")
+        blog_stems = _scan_md_stems(BLOGS_DIR)
         try:
-            blog_template = env.get_template("blog.html")
             for entry in content_type_index["blog"]:
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = BLOGS_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                blog_html = blog_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count
-                )
-                (SITE_DIR / "blogs" / f"{entry['_filename']}.html").write_text(blog_html)
+                render_tasks.append((
+                    "blog.html",
+                    entry,
+                    _md_path(BLOGS_DIR, blog_stems, entry["_filename"]),
+                    str(SITE_DIR / "blogs" / f"{entry['_filename']}.html"),
+                    counts
+                ))
 
             # Generate blogs index page
             print("Generating blogs index...")
             blogs_index_template = env.get_template("blogs_index.html")
-            blogs_index_html = blogs_index_template.render(
+            _write_page(
+                blogs_index_template, SITE_DIR / "blogs" / "index.html",
                 entries=content_type_index["blog"],
-                video_count=video_count,
-                paper_count=paper_count,
-                podcast_count=podcast_count,
-                blog_count=blog_count
+                **counts
             )
-            (SITE_DIR / "blogs" / "index.html").write_text(blogs_index_html)
 
         except Exception as e:
             print(f"  Warning: Could not generate blog pages: {e}")
 
     # Generate course pages
     if course_count > 0:
-        print("Generating course pages...")
+        print("Queueing course pages...")
         COURSES_DIR = BASE_DIR / "courses"
+        course_stems = _scan_md_stems(COURSES_DIR)
         try:
-            course_template = env.get_template("course.html")
             for entry in content_type_index["course"]:
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = COURSES_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                course_html = course_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count
-                )
-                (SITE_DIR / "courses" / f"{entry['_filename']}.html").write_text(course_html)
+                render_tasks.append((
+                    "course.html",
+                    entry,
+                    _md_path(COURSES_DIR, course_stems, entry["_filename"]),
+                    str(SITE_DIR / "courses" / f"{entry['_filename']}.html"),
+                    counts
+                ))
 
             # Generate courses index page
             print("Generating courses index...")
             try:
                 courses_index_template = env.get_template("courses_index.html")
-                courses_index_html = courses_index_template.render(
+                _write_page(
+                    courses_index_template, SITE_DIR / "courses" / "index.html",
                     entries=content_type_index["course"],
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count
+                    **counts
                 )
-                (SITE_DIR / "courses" / "index.html").write_text(courses_index_html)
             except Exception as e:
                 print(f"  Warning: Could not generate courses index: {e}")
 
@@ -518,31 +784,18 @@ def generate_site():
 
     # Generate legal content pages
     if legal_count > 0:
-        print("Generating legal pages...")
+        print("Queueing legal pages...")
         LEGAL_DIR = BASE_DIR / "legal"
+        legal_stems = _scan_md_stems(LEGAL_DIR)
         try:
-            legal_template = env.get_template("legal.html")
             for entry in content_type_index["legal"]:
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = LEGAL_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                legal_html = legal_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count,
-                    legal_count=legal_count
-                )
-                (SITE_DIR / "legal" / f"{entry['_filename']}.html").write_text(legal_html)
+                render_tasks.append((
+                    "legal.html",
+                    entry,
+                    _md_path(LEGAL_DIR, legal_stems, entry["_filename"]),
+                    str(SITE_DIR / "legal" / f"{entry['_filename']}.html"),
+                    counts
+                ))
 
             # Generate legal index page
             print("Generating legal index...")
@@ -551,27 +804,22 @@ def generate_site():
                 jurisdictions = {}
                 for entry in content_type_index["legal"]:
                     code = entry.get("jurisdiction_code", "OTHER")
-                    jurisdiction_name = entry.get("jurisdiction", "Other")
-                    if code not in jurisdictions:
-                        jurisdictions[code] = {
+                    group = jurisdictions.get(code)
+                    if group is None:
+                        group = jurisdictions[code] = {
                             "code": code,
-                            "name": jurisdiction_name,
+                            "name": entry.get("jurisdiction", "Other"),
                             "entries": []
                         }
-                    jurisdictions[code]["entries"].append(entry)
+                    group["entries"].append(entry)
 
                 legal_index_template = env.get_template("legal_index.html")
-                legal_index_html = legal_index_template.render(
+                _write_page(
+                    legal_index_template, SITE_DIR / "legal" / "index.html",
                     entries=content_type_index["legal"],
                     jurisdictions=jurisdictions,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count,
-                    legal_count=legal_count
+                    **counts
                 )
-                (SITE_DIR / "legal" / "index.html").write_text(legal_index_html)
             except Exception as e:
                 print(f"  Warning: Could not generate legal index: {e}")
 
@@ -580,33 +828,19 @@ def generate_site():
 
     # Generate law journal pages
     if journal_count > 0:
-        print("Generating law journal pages...")
+        print("Queueing law journal pages...")
         JOURNALS_DIR = BASE_DIR / "journals"
         (SITE_DIR / "journals").mkdir(parents=True, exist_ok=True)
+        journal_stems = _scan_md_stems(JOURNALS_DIR)
         try:
-            journal_template = env.get_template("law-journal.html")
             for entry in content_type_index["law-journal"]:
-                entry["slug"] = entry["_filename"]
-
-                # Read the markdown content
-                md_file = JOURNALS_DIR / f"{entry['_filename']}.md"
-                if md_file.exists():
-                    md_content = md_file.read_text()
-                else:
-                    md_content = ""
-
-                journal_html = journal_template.render(
-                    entry=entry,
-                    markdown_content=md_content,
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count,
-                    legal_count=legal_count,
-                    journal_count=journal_count
-                )
-                (SITE_DIR / "journals" / f"{entry['_filename']}.html").write_text(journal_html)
+                render_tasks.append((
+                    "law-journal.html",
+                    entry,
+                    _md_path(JOURNALS_DIR, journal_stems, entry["_filename"]),
+                    str(SITE_DIR / "journals" / f"{entry['_filename']}.html"),
+                    counts
+                ))
 
             # Generate journals index page
             print("Generating journals index...")
@@ -616,38 +850,75 @@ def generate_site():
                 for entry in content_type_index["law-journal"]:
                     journal_info = entry.get("journal", {})
                     journal_slug = journal_info.get("slug", "unknown-journal")
-                    journal_name = journal_info.get("name", "Unknown Journal")
-                    if journal_slug not in journals:
-                        journals[journal_slug] = {
+                    group = journals.get(journal_slug)
+                    if group is None:
+                        group = journals[journal_slug] = {
                             "slug": journal_slug,
-                            "name": journal_name,
+                            "name": journal_info.get("name", "Unknown Journal"),
                             "institution": journal_info.get("institution", ""),
                             "entries": []
                         }
-                    journals[journal_slug]["entries"].append(entry)
+                    group["entries"].append(entry)
 
                 # Use legal_index.html as base for now (can create dedicated template later)
                 journals_index_template = env.get_template("legal_index.html")
-                journals_index_html = journals_index_template.render(
+                _write_page(
+                    journals_index_template, SITE_DIR / "journals" / "index.html",
                     entries=content_type_index["law-journal"],
                     jurisdictions=journals,  # Reuse jurisdictions template variable
-                    video_count=video_count,
-                    paper_count=paper_count,
-                    podcast_count=podcast_count,
-                    blog_count=blog_count,
-                    course_count=course_count,
-                    legal_count=legal_count,
-                    journal_count=journal_count,
                     page_title="Law Journals",
-                    is_journals=True
+                    is_journals=True,
+                    **counts
                 )
-                (SITE_DIR / "journals" / "index.html").write_text(journals_index_html)
             except Exception as e:
                 print(f"  Warning: Could not generate journals index: {e}")
 
         except Exception as e:
             print(f"  Warning: Could not generate journal pages: {e}")
 
+    # Deletion pass: without the old rmtree, pages for entries - or for
+    # topics, channels, shows, and letters that no longer have any
+    # entries - would linger in the published site
+    expected_pages = {task[3] for task in render_tasks}
+    derived_pages = {
+        "topics": {f"{topic}.html" for topic in facet_index["topics"]},
+        "channels": {f"{slug}.html" for slug in channel_index},
+        "shows": {f"{slug}.html" for slug in show_index},
+        "browse": {f"{letter}.html" for letter in alphabet},
+    }
+    removed = 0
+    for subdir in ("transcripts", "papers", "podcasts", "blogs",
+                   "courses", "legal", "journals", *derived_pages):
+        page_dir = SITE_DIR / subdir
+        if not page_dir.is_dir():
+            continue
+        keep = derived_pages.get(subdir)
+        with os.scandir(page_dir) as it:
+            for page in it:
+                if not page.name.endswith(".html") or page.name == "index.html":
+                    continue
+                if (page.name not in keep if keep is not None
+                        else page.path not in expected_pages):
+                    os.unlink(page.path)
+                    removed += 1
+    if removed:
+        print(f"  Removed {removed} stale pages")
+
+    # Render queued entry pages across CPU cores, skipping any whose
+    # metadata/markdown/templates are unchanged since the last build
+    total_tasks = len(render_tasks)
+    # Hash of the context shared by every page render; part of each
+    # page's cache signature since a counts or CSS change alters pages
+    # whose own metadata/markdown are untouched
+    context_sig = hashlib.blake2b(repr(sorted(counts.items())).encode("utf-8"),
+                                  digest_size=8).hexdigest()
+    render_tasks = _filter_unchanged(render_tasks, build_cache, new_cache,
+                                     templates_mtime, context_sig)
+    if total_tasks:
+        print(f"  {total_tasks - len(render_tasks)} of {total_tasks} entry pages unchanged")
+    render_entry_pages(render_tasks)
+    _write_json(BUILD_CACHE_FILE, new_cache)
+
     # Write library.json
     print("Writing library.json...")
     library_data = {
@@ -667,1570 +938,295 @@ def generate_site():
         "legal_count": legal_count,
         "journal_count": journal_count
     }
-    with open(SITE_DIR / "library.json", "w") as f:
-        json.dump(library_data, f, indent=2)
+    _write_json(SITE_DIR / "library.json", library_data)
 
-    # Also save to root for agent access
-    with open(BASE_DIR / "library.json", "w") as f:
-        json.dump(library_data, f, indent=2)
+    # Also save to root for agent access - hardlink instead of
+    # serializing and writing the same bytes a second time
+    root_copy = BASE_DIR / "library.json"
+    try:
+        if root_copy.exists():
+            root_copy.unlink()
+        os.link(SITE_DIR / "library.json", root_copy)
+    except OSError:
+        # Cross-filesystem or unsupported: fall back to a plain copy
+        shutil.copyfile(SITE_DIR / "library.json", root_copy)
 
     # Generate agent discovery files
     print("Generating agent discovery files...")
-    generate_agent_files(entries, facet_index, content_type_index)
+    generate_agent_files(entries, facet_index, content_type_index, env)
 
     print(f"\nSite generated at: {SITE_DIR}")
     print(f"Open {SITE_DIR / 'index.html'} in a browser to view")
 
 
-def write_css():
-    """Write the CSS file."""
-    css = '''
-:root {
-    --bg: #1a1a2e;
-    --bg-light: #16213e;
-    --accent: #e94560;
-    --text: #eee;
-    --text-muted: #888;
-    --border: #333;
-    /* Domain accent colors */
-    --domain-law: #7f1d1d;
-    --domain-computer-science: #1e3a8a;
-    --law-tint: rgba(127,29,29,.18);
-    --cs-tint: rgba(30,58,138,.16);
-}
+def _minify_css(css: str) -> str:
+    """Conservative stdlib CSS minifier used when rcssmin isn't installed.
 
-* {
-    box-sizing: border-box;
-    margin: 0;
-    padding: 0;
-}
+    Strips comments and collapses whitespace (string-literal aware, so
+    content: "..." values survive). No selector or declaration dedup -
+    merging rules by identical bodies can reorder the cascade, which
+    isn't worth the handful of bytes it would save on this sheet.
+    """
+    out = []
+    i = 0
+    n = len(css)
+    while i < n:
+        c = css[i]
+        if c == "/" and css.startswith("/*", i):
+            i = css.find("*/", i + 2)
+            i = n if i == -1 else i + 2
+        elif c in "\"'":
+            end = css.find(c, i + 1)
+            end = n if end == -1 else end + 1
+            out.append(css[i:end])
+            i = end
+        elif c.isspace():
+            while i < n and css[i].isspace():
+                i += 1
+            # Whitespace is only significant between two identifier-ish
+            # tokens (e.g. "1px solid", "and (max-width...")
+            if out and i < n and out[-1][-1] not in "{};:,>" and css[i] not in "{};:,>}":
+                out.append(" ")
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
 
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    background: var(--bg);
-    color: var(--text);
-    line-height: 1.6;
-}
 
-.container {
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 2rem;
-}
+def _css_min(css: str) -> str:
+    """Minify CSS with rcssmin when available, else the stdlib fallback."""
+    if rcssmin is not None:
+        return rcssmin.cssmin(css)
+    return _minify_css(css)
 
-header {
-    border-bottom: 1px solid var(--border);
-    padding-bottom: 1rem;
-    margin-bottom: 2rem;
-}
 
-header h1 {
-    color: var(--accent);
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
+@functools.lru_cache(maxsize=1)
+def _critical_css() -> str:
+    """Return the above-the-fold CSS that base.html inlines in <head>.
 
-header a {
-    color: var(--text);
-    text-decoration: none;
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
+    templates/style.css marks the end of its critical section (root vars,
+    reset, body, header) with a "critical:end" comment; everything above
+    it is small enough to inline so first paint doesn't block on the
+    stylesheet request. The full sheet still loads normally - the site's
+    CSP (script-src 'self') rules out the preload/onload async-CSS trick,
+    which needs an inline event handler.
+    """
+    css = (TEMPLATES_DIR / "style.css").read_text()
+    marker = css.find("/* critical:end")
+    if marker != -1:
+        css = css[:marker]
+    return _css_min(css)
+
+
+@functools.lru_cache(maxsize=1)
+def _split_media_css():
+    """Split templates/style.css into base rules and per-media-query CSS.
+
+    Returns (base_css, media_files) where media_files is a list of
+    {"media", "file"} dicts plus the extracted CSS text. Browsers still
+    download stylesheets whose media attribute doesn't match, but they do
+    it at low priority without blocking render, so shipping the mobile
+    breakpoints as separate media-scoped links keeps them off the
+    desktop critical path (and vice versa).
+    """
+    css = (TEMPLATES_DIR / "style.css").read_text()
+    base_parts = []
+    media_blocks = {}  # media query -> list of inner CSS chunks
+    pos = 0
+    while True:
+        at = css.find("@media", pos)
+        if at == -1:
+            base_parts.append(css[pos:])
+            break
+        base_parts.append(css[pos:at])
+        brace = css.index("{", at)
+        media = css[at + len("@media"):brace].strip()
+        # Walk to the matching close brace of the @media block
+        depth = 1
+        i = brace + 1
+        while depth:
+            c = css[i]
+            if c == "{":
+                depth += 1
+            elif c == "}":
+                depth -= 1
+            i += 1
+        media_blocks.setdefault(media, []).append(css[brace + 1:i - 1])
+        pos = i
+
+    media_files = []
+    for media, chunks in media_blocks.items():
+        slug = "".join(c if c.isalnum() else "-" for c in media).strip("-")
+        slug = "-".join(filter(None, slug.split("-")))
+        media_files.append({
+            "media": media,
+            "file": f"style.{slug}.css",
+            "css": "\n".join(chunks)
+        })
+    return "".join(base_parts), media_files
+
+
+@functools.lru_cache(maxsize=1)
+def _css_assets():
+    """Return the minified CSS assets with content-hashed filenames.
+
+    Each asset is {"media", "file", "bytes"}: the base sheet (media
+    None) plus one file per @media block from _split_media_css. The
+    filename embeds a blake2b hash of the minified bytes (fast,
+    non-cryptographic use) so the server can mark /assets/ as
+    immutable-cacheable - returning visitors refetch only the HTML,
+    never unchanged CSS, which offsets the cache loss from inlining the
+    critical section.
+    """
+    base_css, media_files = _split_media_css()
+    assets = []
+    for media, filename, css in (
+            [(None, "style.css", base_css)]
+            + [(m["media"], m["file"], m["css"]) for m in media_files]):
+        data = _css_min(css).encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+        assets.append({
+            "media": media,
+            "file": "%s.%s.css" % (filename[:-len(".css")], digest),
+            "bytes": data
+        })
+    return assets
+
+
+def _write_css_asset(path, css_bytes: bytes):
+    """Write one minified CSS asset plus gzip/brotli precompressed
+    sidecars next to it.
+
+    Filenames are content-hashed, so an unchanged file means the
+    sidecars are current too and the (expensive) recompression can be
+    skipped along with the writes.
+    """
+    if not _write_if_changed(path, css_bytes):
+        return
+    _write_bytes(path.with_name(path.name + ".gz"),
+                 gzip.compress(css_bytes, compresslevel=9))
+    if brotli is not None:
+        _write_bytes(path.with_name(path.name + ".br"),
+                     brotli.compress(css_bytes, quality=11, mode=brotli.MODE_TEXT))
 
-.icon {
-    width: 1.5em;
-    height: 1.5em;
-    stroke: var(--accent);
-}
 
-/* Facet filters */
-.filters {
-    display: flex;
-    gap: 2rem;
-    margin-bottom: 2rem;
-    flex-wrap: wrap;
-}
+def write_css():
+    """Write the stylesheets and precompressed sidecars into site assets.
+
+    The CSS lives in templates/style.css so it can be edited without
+    touching Python. It is split into a base sheet plus media-scoped
+    sheets (see _split_media_css), minified, written under
+    content-hashed filenames (see _css_assets), and each file gets
+    .gz/.br sidecars so the web server can serve precompressed bytes
+    instead of compressing the same content on every request. High
+    compression levels are fine here - it's a one-shot cost at build
+    time. Hashed files from earlier builds are removed first; every
+    current page references the current hash, so nothing links to them.
+    """
+    assets_dir = SITE_DIR / "assets"
+    current = {a["file"] for a in _css_assets()}
+    with os.scandir(assets_dir) as it:
+        for existing in it:
+            if (existing.name.startswith("style.")
+                    and existing.name.split(".css")[0] + ".css" not in current):
+                os.unlink(existing.path)
+    for asset in _css_assets():
+        _write_css_asset(assets_dir / asset["file"], asset["bytes"])
 
-.filter-group h3 {
-    color: var(--text-muted);
-    font-size: 0.85rem;
-    text-transform: uppercase;
-    margin-bottom: 0.5rem;
-}
+    # Write library.js (external JS for CSP compliance)
+    library_js = '''// Configuration
+const CONFIG = {
+    API_URL: 'https://youtube-library-api.dlkarpay.workers.dev'
+};
 
-.filter-group .tags {
-    display: flex;
-    gap: 0.5rem;
-    flex-wrap: wrap;
-}
+// DOM Elements
+const searchInput = document.getElementById('search-input');
+const searchBtn = document.getElementById('search-btn');
+const clearBtn = document.getElementById('clear-search');
+const searchResults = document.getElementById('search-results');
+const libraryContent = document.getElementById('library-content');
+const chatInput = document.getElementById('chat-input');
+const chatBtn = document.getElementById('chat-btn');
+const chatContainer = document.getElementById('chat-container');
+const chatMessages = document.getElementById('chat-messages');
+const docentBtn = document.getElementById('docent-btn');
+const docentModal = document.getElementById('docent-modal');
+const docentClose = document.getElementById('docent-close');
 
-.tag {
-    background: var(--bg-light);
-    color: var(--text);
-    padding: 0.25rem 0.75rem;
-    border-radius: 1rem;
-    font-size: 0.85rem;
-    text-decoration: none;
-    border: 1px solid var(--border);
-    transition: all 0.2s;
-}
+let libraryData = null;
 
-.tag:hover {
-    border-color: var(--accent);
-    color: var(--accent);
+function formatDuration(seconds) {
+    if (!seconds) return '0m';
+    if (seconds < 60) return `${seconds}s`;
+    if (seconds < 3600) return `${Math.floor(seconds / 60)}m`;
+    const h = Math.floor(seconds / 3600);
+    const m = Math.floor((seconds % 3600) / 60);
+    return `${h}h ${m}m`;
 }
 
-.tag.active {
-    background: var(--accent);
-    border-color: var(--accent);
+async function loadLibraryData() {
+    if (libraryData) return libraryData;
+    try {
+        const response = await fetch('/library.json');
+        libraryData = await response.json();
+        return libraryData;
+    } catch (err) {
+        console.error('Failed to load library.json:', err);
+        return null;
+    }
 }
 
-/* Entry cards */
-.entries {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-    gap: 1.5rem;
+function clientSideSearch(query, entries) {
+    const terms = query.toLowerCase().split(/\\s+/).filter(t => t.length > 1);
+    if (terms.length === 0) return [];
+    const scored = entries.map(entry => {
+        let score = 0;
+        const title = (entry.title || '').toLowerCase();
+        const summary = (entry.summary || []).join(' ').toLowerCase();
+        const topics = (entry.facets?.topics || []).join(' ').toLowerCase();
+        for (const term of terms) {
+            if (title.includes(term)) score += 10;
+            if (summary.includes(term)) score += 5;
+            if (topics.includes(term)) score += 3;
+        }
+        return { entry, score };
+    });
+    return scored.filter(s => s.score > 0).sort((a, b) => b.score - a.score).slice(0, 20).map(s => s.entry);
 }
 
-.entry-card {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    padding: 1.5rem;
-    transition: border-color 0.2s;
+function getContentUrl(entry) {
+    const type = entry.content_type || 'video';
+    const filename = entry._filename || entry.slug;
+    if (type === 'paper') return `papers/${filename}.html`;
+    if (type === 'podcast') return `podcasts/${filename}.html`;
+    if (type === 'blog') return `blogs/${filename}.html`;
+    if (type === 'legal') return `legal/${filename}.html`;
+    if (type === 'law-journal') return `journals/${filename}.html`;
+    return `transcripts/${filename}.html`;
 }
 
-.entry-card:hover {
-    border-color: var(--accent);
-}
-
-.entry-card h2 {
-    font-size: 1.1rem;
-    margin-bottom: 0.5rem;
-}
-
-.entry-card h2 a {
-    color: var(--text);
-    text-decoration: none;
-}
-
-.entry-card h2 a:hover {
-    color: var(--accent);
-}
-
-.entry-meta {
-    color: var(--text-muted);
-    font-size: 0.85rem;
-    margin-bottom: 1rem;
-}
-
-.entry-summary {
-    font-size: 0.9rem;
-    color: var(--text-muted);
-}
-
-.entry-summary ul {
-    list-style: none;
-    padding-left: 0;
-}
-
-.entry-summary li::before {
-    content: "→ ";
-    color: var(--accent);
-}
-
-/* Transcript page */
-.transcript-header {
-    margin-bottom: 2rem;
-}
-
-.video-embed {
-    position: relative;
-    padding-bottom: 56.25%;
-    margin-bottom: 2rem;
-    background: #000;
-    border-radius: 0.5rem;
-    overflow: hidden;
-}
-
-.video-embed iframe {
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-}
-
-.sections-nav {
-    background: var(--bg-light);
-    padding: 1.5rem;
-    border-radius: 0.5rem;
-    margin-bottom: 2rem;
-}
-
-.sections-nav h3 {
-    margin-bottom: 1rem;
-    color: var(--accent);
-}
-
-.sections-nav ul {
-    list-style: none;
-}
-
-.sections-nav li {
-    margin-bottom: 0.5rem;
-}
-
-.sections-nav a {
-    color: var(--text);
-    text-decoration: none;
-}
-
-.sections-nav a:hover {
-    color: var(--accent);
-}
-
-.sections-nav .timestamp {
-    color: var(--text-muted);
-    font-family: monospace;
-    margin-right: 0.5rem;
-}
-
-/* Full transcript */
-.transcript-content {
-    background: var(--bg-light);
-    padding: 2rem;
-    border-radius: 0.5rem;
-}
-
-.transcript-content h2,
-.transcript-content h3 {
-    color: var(--accent);
-    margin: 1.5rem 0 1rem;
-}
-
-.transcript-content .timestamp {
-    color: var(--text-muted);
-    font-family: monospace;
-    font-size: 0.8rem;
-    margin-right: 0.5rem;
-    opacity: 0.6;
-}
-
-.transcript-content p {
-    margin-bottom: 0.5rem;
-}
-
-/* Margin timestamp transcript viewer (Akademie Ausgabe style) */
-.transcript-prose {
-    padding-left: 5.5rem;
-    position: relative;
-    line-height: 1.9;
-    font-size: 1rem;
-}
-
-.margin-timestamp {
-    position: absolute;
-    left: 0;
-    width: 4.5rem;
-    text-align: right;
-    font-family: 'SF Mono', 'Menlo', 'Monaco', 'Consolas', monospace;
-    font-size: 0.65rem;
-    color: var(--text-muted);
-    opacity: 0.35;
-    user-select: none;
-    transition: opacity 0.15s ease;
-}
-
-.margin-timestamp:hover {
-    opacity: 0.85;
-    color: var(--accent);
-}
-
-.margin-timestamp a {
-    color: inherit;
-    text-decoration: none;
-}
-
-.prose-segment {
-    display: inline;
-}
-
-/* Mobile: inline superscript timestamps */
-@media (max-width: 640px) {
-    .transcript-prose {
-        padding-left: 0;
-    }
-
-    .margin-timestamp {
-        position: static;
-        display: inline;
-        width: auto;
-        opacity: 0.2;
-        font-size: 0.55rem;
-        vertical-align: super;
-        margin-right: 0.2rem;
-    }
-}
-
-/* Summary */
-.summary {
-    background: var(--bg-light);
-    padding: 1.5rem;
-    border-radius: 0.5rem;
-    margin-bottom: 2rem;
-    border-left: 3px solid var(--accent);
-}
-
-.summary h3 {
-    color: var(--accent);
-    margin-bottom: 1rem;
-}
-
-.summary ul {
-    list-style: none;
-}
-
-.summary li {
-    margin-bottom: 0.5rem;
-}
-
-.summary li::before {
-    content: "• ";
-    color: var(--accent);
-}
-
-/* Back link */
-.back-link {
-    display: inline-block;
-    margin-bottom: 1rem;
-    color: var(--text-muted);
-    text-decoration: none;
-}
-
-.back-link:hover {
-    color: var(--accent);
-}
-
-/* Main Navigation */
-.main-nav {
-    display: flex;
-    gap: 1.5rem;
-    margin-top: 0.75rem;
-    flex-wrap: wrap;
-    align-items: center;
-}
-
-.main-nav a {
-    color: var(--text-muted);
-    text-decoration: none;
-    font-size: 0.9rem;
-    transition: color 0.2s;
-}
-
-.main-nav a:hover {
-    color: var(--accent);
-}
-
-.main-nav a.active {
-    color: var(--accent);
-}
-
-.nav-divider {
-    color: var(--border);
-}
-
-/* Channel List */
-.channel-list {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-    gap: 1rem;
-}
-
-.channel-card {
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    padding: 1rem 1.25rem;
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    text-decoration: none;
-    color: var(--text);
-    transition: border-color 0.2s;
-}
-
-.channel-card:hover {
-    border-color: var(--accent);
-}
-
-.channel-name {
-    font-weight: 500;
-}
-
-.channel-count {
-    color: var(--text-muted);
-    font-size: 0.85rem;
-}
-
-.channel-link {
-    color: var(--accent);
-    text-decoration: none;
-}
-
-.channel-link:hover {
-    text-decoration: underline;
-}
-
-/* Letter Navigation */
-.letter-nav {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 0.5rem;
-    margin-bottom: 1.5rem;
-    padding: 1rem;
-    background: var(--bg-light);
-    border-radius: 0.5rem;
-}
-
-.letter-link {
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    width: 2rem;
-    height: 2rem;
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 0.25rem;
-    color: var(--text);
-    text-decoration: none;
-    font-weight: 500;
-    font-size: 0.9rem;
-    transition: all 0.2s;
-}
-
-.letter-link:hover {
-    border-color: var(--accent);
-    color: var(--accent);
-}
-
-.letter-link.active {
-    background: var(--accent);
-    border-color: var(--accent);
-    color: var(--bg);
-}
-
-/* Search Container */
-.search-container {
-    display: flex;
-    gap: 0.5rem;
-    margin-bottom: 2rem;
-}
-
-#search-input {
-    flex: 1;
-    padding: 0.75rem 1rem;
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    color: var(--text);
-    font-size: 1rem;
-}
-
-#search-input:focus {
-    outline: none;
-    border-color: var(--accent);
-}
-
-#search-input::placeholder {
-    color: var(--text-muted);
-}
-
-#search-btn, #clear-search {
-    padding: 0.75rem 1.5rem;
-    background: var(--accent);
-    border: none;
-    border-radius: 0.5rem;
-    color: white;
-    cursor: pointer;
-    font-size: 0.9rem;
-    transition: opacity 0.2s;
-}
-
-#search-btn:hover, #clear-search:hover {
-    opacity: 0.9;
-}
-
-#clear-search {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    color: var(--text);
-}
-
-/* Search Results */
-.search-results {
-    margin-bottom: 2rem;
-}
-
-.search-result-card {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    padding: 1.5rem;
-    margin-bottom: 1rem;
-}
-
-.search-result-card mark {
-    background: var(--accent);
-    color: white;
-    padding: 0 0.2rem;
-    border-radius: 0.2rem;
-}
-
-.matching-sections {
-    margin-top: 1rem;
-    padding-top: 1rem;
-    border-top: 1px solid var(--border);
-}
-
-.matching-section {
-    margin-top: 0.75rem;
-    padding: 0.75rem;
-    background: var(--bg);
-    border-radius: 0.25rem;
-    font-size: 0.9rem;
-}
-
-.matching-section .timestamp {
-    color: var(--accent);
-    font-family: monospace;
-}
-
-.matching-section a {
-    color: var(--text);
-    text-decoration: none;
-}
-
-.matching-section a:hover {
-    color: var(--accent);
-}
-
-.matching-section p {
-    margin-top: 0.5rem;
-    color: var(--text-muted);
-}
-
-/* Dual Search Interface */
-.dual-search {
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 1.5rem;
-    margin-bottom: 2rem;
-}
-
-.search-panel, .chat-panel {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    padding: 1rem;
-    min-height: 300px;
-    display: flex;
-    flex-direction: column;
-}
-
-.panel-title {
-    color: var(--accent);
-    font-size: 0.9rem;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    margin-bottom: 1rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 1px solid var(--border);
-}
-
-.search-panel .search-container {
-    margin-bottom: 0.5rem;
-}
-
-.search-explainer {
-    color: var(--text-muted);
-    font-size: 0.75rem;
-    margin: 0 0 1rem 0;
-    opacity: 0.8;
-}
-
-.search-panel .search-results {
-    flex: 1;
-    overflow-y: auto;
-    max-height: 400px;
-}
-
-/* Chat Interface */
-.chat-container {
-    flex: 1;
-    display: flex;
-    flex-direction: column;
-}
-
-.chat-messages {
-    flex: 1;
-    overflow-y: auto;
-    max-height: 350px;
-    padding: 0.5rem;
-    background: var(--bg);
-    border-radius: 0.25rem;
-    margin-bottom: 1rem;
-}
-
-.chat-message {
-    margin-bottom: 1rem;
-    padding: 0.75rem 1rem;
-    border-radius: 0.5rem;
-    font-size: 0.9rem;
-    line-height: 1.5;
-}
-
-.chat-message.user {
-    background: var(--accent);
-    color: white;
-    margin-left: 2rem;
-}
-
-.chat-message.assistant {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    margin-right: 2rem;
-}
-
-.chat-message.loading {
-    opacity: 0.6;
-    font-style: italic;
-}
-
-.chat-message p {
-    margin: 0;
-}
-
-.chat-videos {
-    margin-top: 0.75rem;
-    padding-top: 0.75rem;
-    border-top: 1px solid var(--border);
-}
-
-.chat-videos ul {
-    list-style: none;
-    margin-top: 0.5rem;
-}
-
-.chat-videos li {
-    margin-bottom: 0.4rem;
-}
-
-.chat-videos a {
-    color: var(--text);
-    text-decoration: none;
-}
-
-.chat-videos a:hover {
-    color: var(--accent);
-}
-
-.chat-videos .meta {
-    color: var(--text-muted);
-    font-size: 0.8rem;
-}
-
-/* Chat message formatting */
-.chat-message h3, .chat-message h4 {
-    color: var(--accent);
-    margin: 0.75rem 0 0.5rem 0;
-    font-size: 0.95rem;
-}
-
-.chat-message h3:first-child, .chat-message h4:first-child {
-    margin-top: 0;
-}
-
-.chat-message ul {
-    margin: 0.5rem 0;
-    padding-left: 1.25rem;
-}
-
-.chat-message li {
-    margin-bottom: 0.3rem;
-}
-
-.chat-message .timestamp {
-    font-family: monospace;
-    background: var(--bg);
-    padding: 0.1rem 0.3rem;
-    border-radius: 0.2rem;
-    font-size: 0.8rem;
-    color: var(--accent);
-}
-
-.chat-table {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 0.75rem 0;
-    font-size: 0.85rem;
-}
-
-.chat-table th, .chat-table td {
-    padding: 0.5rem 0.75rem;
-    text-align: left;
-    border-bottom: 1px solid var(--border);
-}
-
-.chat-table th {
-    background: var(--bg);
-    color: var(--accent);
-    font-weight: 600;
-    font-size: 0.8rem;
-    text-transform: uppercase;
-}
-
-.chat-table tr:hover {
-    background: rgba(233, 69, 96, 0.05);
-}
-
-.chat-message em {
-    color: var(--text-muted);
-}
-
-/* Search History Panel */
-.history-panel {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    margin-bottom: 2rem;
-}
-
-.history-header {
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    padding: 0.75rem 1rem;
-    border-bottom: 1px solid var(--border);
-}
-
-.history-header .panel-title {
-    margin: 0;
-    padding: 0;
-    border: none;
-}
-
-.history-controls {
-    display: flex;
-    gap: 0.5rem;
-}
-
-.history-toggle, .history-clear {
-    padding: 0.35rem 0.75rem;
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 0.25rem;
-    color: var(--text-muted);
-    cursor: pointer;
-    font-size: 0.8rem;
-    transition: all 0.2s;
-}
-
-.history-toggle:hover, .history-clear:hover {
-    border-color: var(--accent);
-    color: var(--accent);
-}
-
-.history-content {
-    padding: 1rem;
-    max-height: 300px;
-    overflow-y: auto;
-}
-
-.history-list {
-    display: flex;
-    flex-direction: column;
-    gap: 0.5rem;
-}
-
-.history-empty {
-    color: var(--text-muted);
-    text-align: center;
-    padding: 1rem;
-    font-size: 0.9rem;
-}
-
-.history-item {
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    padding: 0.6rem 0.75rem;
-    background: var(--bg);
-    border-radius: 0.25rem;
-    gap: 1rem;
-}
-
-.history-item:hover {
-    background: rgba(233, 69, 96, 0.05);
-}
-
-.history-item-main {
-    display: flex;
-    align-items: center;
-    gap: 0.75rem;
-    flex: 1;
-    min-width: 0;
-}
-
-.history-type {
-    padding: 0.2rem 0.5rem;
-    border-radius: 0.2rem;
-    font-size: 0.7rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    flex-shrink: 0;
-}
-
-.history-type.keyword {
-    background: var(--bg-light);
-    color: var(--text-muted);
-    border: 1px solid var(--border);
-}
-
-.history-type.ai {
-    background: var(--accent);
-    color: white;
-}
-
-.history-query {
-    font-size: 0.9rem;
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-}
-
-.history-item-meta {
-    display: flex;
-    align-items: center;
-    gap: 0.75rem;
-    flex-shrink: 0;
-}
-
-.history-time {
-    color: var(--text-muted);
-    font-size: 0.75rem;
-}
-
-.history-results {
-    color: var(--text-muted);
-    font-size: 0.75rem;
-}
-
-.history-rerun {
-    padding: 0.25rem 0.5rem;
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.2rem;
-    color: var(--text);
-    cursor: pointer;
-    font-size: 0.75rem;
-}
-
-.history-rerun:hover {
-    border-color: var(--accent);
-    color: var(--accent);
-}
-
-.history-delete {
-    padding: 0.15rem 0.4rem;
-    background: transparent;
-    border: none;
-    color: var(--text-muted);
-    cursor: pointer;
-    font-size: 1rem;
-    line-height: 1;
-}
-
-.history-delete:hover {
-    color: var(--accent);
-}
-
-/* Paper-specific styles */
-.content-type-badge {
-    display: inline-block;
-    padding: 0.2rem 0.6rem;
-    border-radius: 0.25rem;
-    font-size: 0.7rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.03em;
-    margin-bottom: 0.5rem;
-}
-
-.paper-badge {
-    background: #6366f1;
-    color: white;
-}
-
-.video-badge {
-    background: #ef4444;
-    color: white;
-}
-
-.podcast-badge {
-    background: #22c55e;
-    color: white;
-}
-
-.blog-badge {
-    background: #f59e0b;
-    color: white;
-}
-
-.legal-badge {
-    background: #7f1d1d;
-    color: white;
-}
-
-.journal-badge {
-    background: #be185d;
-    color: white;
-}
-
-/* Entry badges container */
-.entry-badges {
-    display: flex;
-    gap: 0.5rem;
-    align-items: center;
-    margin-bottom: 0.5rem;
-    flex-wrap: wrap;
-}
-
-.paper-header {
-    margin-bottom: 2rem;
-}
-
-.paper-meta .authors {
-    font-size: 0.95rem;
-    color: var(--text);
-}
-
-.paper-links {
-    display: flex;
-    align-items: center;
-    gap: 0.75rem;
-    flex-wrap: wrap;
-}
-
-.upvotes {
-    color: #22c55e;
-    font-weight: 600;
-}
-
-.abstract {
-    background: var(--bg-light);
-    padding: 1.5rem;
-    border-radius: 0.5rem;
-    margin-bottom: 2rem;
-    border-left: 3px solid #6366f1;
-}
-
-.abstract h3 {
-    color: #6366f1;
-    margin-bottom: 1rem;
-}
-
-.abstract p {
-    line-height: 1.7;
-}
-
-.paper-content {
-    background: var(--bg-light);
-    padding: 2rem;
-    border-radius: 0.5rem;
-}
-
-.paper-content h3 {
-    color: #6366f1;
-    margin-bottom: 1rem;
-}
-
-.papers-list .entry-card {
-    border-left: 3px solid #6366f1;
-}
-
-.entry-list {
-    list-style: none;
-}
-
-.entry-card {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    padding: 1.25rem;
-    margin-bottom: 1rem;
-    transition: border-color 0.2s;
-}
-
-.entry-card:hover {
-    border-color: var(--accent);
-}
-
-.entry-header {
-    display: flex;
-    align-items: flex-start;
-    gap: 0.75rem;
-    flex-wrap: wrap;
-}
-
-.entry-title {
-    color: var(--text);
-    text-decoration: none;
-    font-size: 1.1rem;
-    font-weight: 500;
-}
-
-.entry-title:hover {
-    color: var(--accent);
-}
-
-.entry-summary {
-    margin-top: 0.75rem;
-    color: var(--text-muted);
-    font-size: 0.9rem;
-    line-height: 1.5;
-}
-
-/* Domain separation styles */
-.entry-card {
-    position: relative;
-    border-left: 4px solid var(--border);
-}
-
-.entry-card.domain-law {
-    border-left-color: var(--domain-law);
-}
-
-.entry-card.domain-computer-science {
-    border-left-color: var(--domain-computer-science);
-}
-
-/* Domain badge */
-.domain-badge {
-    display: inline-flex;
-    align-items: center;
-    gap: 0.35rem;
-    padding: 0.2rem 0.5rem;
-    border-radius: 999px;
-    font-size: 0.7rem;
-    font-weight: 500;
-    text-transform: uppercase;
-    letter-spacing: 0.03em;
-    background: rgba(255,255,255,0.05);
-    border: 1px solid var(--border);
-}
-
-.domain-badge::before {
-    content: "";
-    width: 6px;
-    height: 6px;
-    border-radius: 999px;
-    background: var(--border);
-}
-
-.domain-badge.law {
-    border-color: rgba(127,29,29,.5);
-    color: #fca5a5;
-}
-
-.domain-badge.law::before {
-    background: var(--domain-law);
-}
-
-.domain-badge.computer-science {
-    border-color: rgba(30,58,138,.5);
-    color: #93c5fd;
-}
-
-.domain-badge.computer-science::before {
-    background: var(--domain-computer-science);
-}
-
-/* Domain filter toggle */
-.domain-filter {
-    display: inline-flex;
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 999px;
-    overflow: hidden;
-    margin-left: 1rem;
-}
-
-.domain-filter a {
-    padding: 0.35rem 0.75rem;
-    font-size: 0.8rem;
-    color: var(--text-muted);
-    text-decoration: none;
-    transition: background 0.2s, color 0.2s;
-}
-
-.domain-filter a:hover {
-    background: rgba(255,255,255,0.05);
-}
-
-.domain-filter a.active {
-    background: var(--bg-light);
-    color: var(--text);
-}
-
-.tag-small {
-    font-size: 0.75rem;
-    padding: 0.15rem 0.5rem;
-}
-
-.empty-state {
-    text-align: center;
-    padding: 3rem;
-    color: var(--text-muted);
-}
-
-.empty-state code {
-    background: var(--bg);
-    padding: 0.2rem 0.5rem;
-    border-radius: 0.25rem;
-    font-size: 0.9rem;
-}
-
-.subtitle {
-    color: var(--text-muted);
-    font-size: 0.95rem;
-    margin-top: 0.25rem;
-}
-
-.chat-input-container {
-    display: flex;
-    gap: 0.5rem;
-}
-
-#chat-input {
-    flex: 1;
-    padding: 0.6rem 0.75rem;
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 0.25rem;
-    color: var(--text);
-    font-size: 0.9rem;
-}
-
-#chat-input:focus {
-    outline: none;
-    border-color: var(--accent);
-}
-
-#chat-input::placeholder {
-    color: var(--text-muted);
-}
-
-#chat-btn {
-    padding: 0.6rem 1rem;
-    background: var(--accent);
-    border: none;
-    border-radius: 0.25rem;
-    color: white;
-    cursor: pointer;
-    font-size: 0.85rem;
-}
-
-#chat-btn:hover {
-    opacity: 0.9;
-}
-
-/* Responsive: stack on mobile */
-@media (max-width: 900px) {
-    .dual-search {
-        grid-template-columns: 1fr;
-    }
-
-    .search-panel, .chat-panel {
-        min-height: 250px;
-    }
-
-    .chat-messages {
-        max-height: 250px;
-    }
-}
-
-/* === Hero Section (Above the Fold) === */
-.hero {
-    min-height: 50vh;
-    display: flex;
-    flex-direction: column;
-    justify-content: center;
-    align-items: center;
-    padding: 2rem;
-    margin-bottom: 2rem;
-}
-
-.hero-search {
-    width: 100%;
-    max-width: 700px;
-    display: flex;
-    gap: 0.5rem;
-    margin-bottom: 1rem;
-}
-
-.hero-search input {
-    flex: 1;
-    padding: 1rem 1.25rem;
-    background: var(--bg-light);
-    border: 2px solid var(--border);
-    border-radius: 0.5rem;
-    color: var(--text);
-    font-size: 1.1rem;
-}
-
-.hero-search input:focus {
-    outline: none;
-    border-color: var(--accent);
-}
-
-.hero-search input::placeholder {
-    color: var(--text-muted);
-}
-
-.hero-search button {
-    padding: 1rem 1.5rem;
-    background: var(--accent);
-    border: none;
-    border-radius: 0.5rem;
-    color: white;
-    cursor: pointer;
-    font-size: 1rem;
-    font-weight: 500;
-}
-
-.hero-search button:hover {
-    opacity: 0.9;
-}
-
-.hero-search #clear-search {
-    background: var(--bg-light);
-    border: 2px solid var(--border);
-    color: var(--text);
-}
-
-.hero-chat {
-    width: 100%;
-    max-width: 700px;
-    display: flex;
-    gap: 0.5rem;
-    margin-bottom: 2rem;
-}
-
-.hero-chat input {
-    flex: 1;
-    padding: 0.75rem 1rem;
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    color: var(--text);
-    font-size: 0.95rem;
-}
-
-.hero-chat input:focus {
-    outline: none;
-    border-color: var(--accent);
-}
-
-.hero-chat input::placeholder {
-    color: var(--text-muted);
-}
-
-.hero-chat button {
-    padding: 0.75rem 1.25rem;
-    background: var(--bg-light);
-    border: 1px solid var(--accent);
-    border-radius: 0.5rem;
-    color: var(--accent);
-    cursor: pointer;
-    font-size: 0.9rem;
-}
-
-.hero-chat button:hover {
-    background: var(--accent);
-    color: white;
-}
-
-/* Docent Desk */
-.docent-desk {
-    margin-top: 1rem;
-}
-
-.docent-icon {
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    gap: 0.5rem;
-    background: transparent;
-    border: none;
-    color: var(--text-muted);
-    cursor: pointer;
-    padding: 1rem;
-    transition: color 0.2s;
-}
-
-.docent-icon:hover {
-    color: var(--accent);
-}
-
-.docent-icon svg {
-    width: 2rem;
-    height: 2rem;
-}
-
-.docent-icon span {
-    font-size: 0.85rem;
-}
-
-/* Chat Container (Expandable) */
-.chat-container-expandable {
-    max-width: 700px;
-    margin: 0 auto 2rem;
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.5rem;
-    padding: 1rem;
-}
-
-.chat-container-expandable .chat-messages {
-    max-height: 400px;
-    overflow-y: auto;
-    padding: 0.5rem;
-    background: var(--bg);
-    border-radius: 0.25rem;
-}
-
-/* Modal */
-.modal {
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    background: rgba(0, 0, 0, 0.8);
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    z-index: 1000;
-}
-
-.modal-content {
-    background: var(--bg-light);
-    border: 1px solid var(--border);
-    border-radius: 0.75rem;
-    padding: 2rem;
-    max-width: 600px;
-    width: 90%;
-    max-height: 80vh;
-    overflow-y: auto;
-    position: relative;
-}
-
-.modal-close {
-    position: absolute;
-    top: 1rem;
-    right: 1rem;
-    background: transparent;
-    border: none;
-    color: var(--text-muted);
-    font-size: 1.5rem;
-    cursor: pointer;
-    line-height: 1;
-}
-
-.modal-close:hover {
-    color: var(--accent);
-}
-
-.modal-content h2 {
-    color: var(--accent);
-    margin-bottom: 1.5rem;
-}
-
-.docent-section {
-    margin-bottom: 1.5rem;
-}
-
-.docent-section h3 {
-    color: var(--text);
-    font-size: 0.9rem;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    margin-bottom: 0.75rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 1px solid var(--border);
-}
-
-.docent-section ul {
-    list-style: none;
-    padding: 0;
-}
-
-.docent-section li {
-    margin-bottom: 0.5rem;
-    color: var(--text-muted);
-}
-
-.docent-section a {
-    color: var(--accent);
-    text-decoration: none;
-}
-
-.docent-section a:hover {
-    text-decoration: underline;
-}
-
-.docent-section code {
-    background: var(--bg);
-    padding: 0.2rem 0.5rem;
-    border-radius: 0.25rem;
-    font-size: 0.85rem;
-}
-
-.api-endpoints {
-    font-family: monospace;
-    font-size: 0.85rem;
-}
-
-.api-endpoints li {
-    margin-bottom: 0.25rem;
-}
-
-/* Search feedback */
-.search-loading, .search-empty, .search-count {
-    color: var(--text-muted);
-    padding: 1rem;
-}
-
-.search-count {
-    margin-bottom: 1rem;
-}
-
-/* Mobile hero adjustments */
-@media (max-width: 600px) {
-    .hero {
-        min-height: 40vh;
-        padding: 1rem;
-    }
-
-    .hero-search input, .hero-chat input {
-        font-size: 1rem;
-        padding: 0.75rem 1rem;
-    }
-
-    .hero-search button, .hero-chat button {
-        padding: 0.75rem 1rem;
-    }
-}
-'''
-    (SITE_DIR / "assets" / "style.css").write_text(css)
-
-    # Write library.js (external JS for CSP compliance)
-    library_js = '''// Configuration
-const CONFIG = {
-    API_URL: 'https://youtube-library-api.dlkarpay.workers.dev'
-};
-
-// DOM Elements
-const searchInput = document.getElementById('search-input');
-const searchBtn = document.getElementById('search-btn');
-const clearBtn = document.getElementById('clear-search');
-const searchResults = document.getElementById('search-results');
-const libraryContent = document.getElementById('library-content');
-const chatInput = document.getElementById('chat-input');
-const chatBtn = document.getElementById('chat-btn');
-const chatContainer = document.getElementById('chat-container');
-const chatMessages = document.getElementById('chat-messages');
-const docentBtn = document.getElementById('docent-btn');
-const docentModal = document.getElementById('docent-modal');
-const docentClose = document.getElementById('docent-close');
-
-let libraryData = null;
-
-function formatDuration(seconds) {
-    if (!seconds) return '0m';
-    if (seconds < 60) return `${seconds}s`;
-    if (seconds < 3600) return `${Math.floor(seconds / 60)}m`;
-    const h = Math.floor(seconds / 3600);
-    const m = Math.floor((seconds % 3600) / 60);
-    return `${h}h ${m}m`;
-}
-
-async function loadLibraryData() {
-    if (libraryData) return libraryData;
-    try {
-        const response = await fetch('/library.json');
-        libraryData = await response.json();
-        return libraryData;
-    } catch (err) {
-        console.error('Failed to load library.json:', err);
-        return null;
-    }
-}
-
-function clientSideSearch(query, entries) {
-    const terms = query.toLowerCase().split(/\\s+/).filter(t => t.length > 1);
-    if (terms.length === 0) return [];
-    const scored = entries.map(entry => {
-        let score = 0;
-        const title = (entry.title || '').toLowerCase();
-        const summary = (entry.summary || []).join(' ').toLowerCase();
-        const topics = (entry.facets?.topics || []).join(' ').toLowerCase();
-        for (const term of terms) {
-            if (title.includes(term)) score += 10;
-            if (summary.includes(term)) score += 5;
-            if (topics.includes(term)) score += 3;
-        }
-        return { entry, score };
-    });
-    return scored.filter(s => s.score > 0).sort((a, b) => b.score - a.score).slice(0, 20).map(s => s.entry);
-}
-
-function getContentUrl(entry) {
-    const type = entry.content_type || 'video';
-    const filename = entry._filename || entry.slug;
-    if (type === 'paper') return `papers/${filename}.html`;
-    if (type === 'podcast') return `podcasts/${filename}.html`;
-    if (type === 'blog') return `blogs/${filename}.html`;
-    if (type === 'legal') return `legal/${filename}.html`;
-    if (type === 'law-journal') return `journals/${filename}.html`;
-    return `transcripts/${filename}.html`;
-}
-
-async function performSearch() {
-    const query = searchInput.value.trim();
-    if (!query) return;
-    searchResults.innerHTML = '<p class="search-loading">Searching...</p>';
-    searchResults.style.display = 'block';
-    libraryContent.style.display = 'none';
-    clearBtn.style.display = 'inline-block';
-    try {
-        const response = await fetch(`/api/search?q=${encodeURIComponent(query)}&limit=20`);
-        if (!response.ok) throw new Error('Server not available');
-        const data = await response.json();
-        if (data.error) throw new Error(data.error);
-        renderSearchResults(data.results, data.total, query);
-    } catch (err) {
-        const data = await loadLibraryData();
-        if (!data?.entries) {
-            searchResults.innerHTML = '<p class="search-empty">Could not load library data.</p>';
-            return;
-        }
-        const results = clientSideSearch(query, data.entries);
-        renderSearchResults(results, results.length, query, true);
-    }
+async function performSearch() {
+    const query = searchInput.value.trim();
+    if (!query) return;
+    searchResults.innerHTML = '<p class="search-loading">Searching...</p>';
+    searchResults.style.display = 'block';
+    libraryContent.style.display = 'none';
+    clearBtn.style.display = 'inline-block';
+    try {
+        const response = await fetch(`/api/search?q=${encodeURIComponent(query)}&limit=20`);
+        if (!response.ok) throw new Error('Server not available');
+        const data = await response.json();
+        if (data.error) throw new Error(data.error);
+        renderSearchResults(data.results, data.total, query);
+    } catch (err) {
+        const data = await loadLibraryData();
+        if (!data?.entries) {
+            searchResults.innerHTML = '<p class="search-empty">Could not load library data.</p>';
+            return;
+        }
+        const results = clientSideSearch(query, data.entries);
+        renderSearchResults(results, results.length, query, true);
+    }
 }
 
 function renderSearchResults(results, total, query, isClientSide = false) {
@@ -2361,7 +1357,7 @@ document.querySelectorAll('.tag[data-filter]').forEach(tag => {
     });
 });
 '''
-    (SITE_DIR / "assets" / "library.js").write_text(library_js)
+    _write_bytes(SITE_DIR / "assets" / "library.js", library_js.encode("utf-8"))
 
 
 def copy_widget_files():
@@ -2382,8 +1378,63 @@ def copy_widget_files():
         print("  Warning: docent-widget.css not found")
 
 
-def generate_agent_files(entries: list, facet_index: dict, content_type_index: dict):
-    """Generate agent discovery files: robots.txt, sitemap.xml, llms.txt, ai.json."""
+# Sitemap directory for each content type's entry pages; unlisted types
+# fall back to transcripts/ via dict.get, matching the old if/elif chain
+_URL_PREFIX = {
+    "paper": "papers/",
+    "podcast": "podcasts/",
+    "blog": "blogs/",
+    "video": "transcripts/",
+}
+
+# Precompiled %-templates for sitemap <url> blocks; a single %s
+# substitution is the cheapest formatting path in CPython and the
+# constants avoid rebuilding the literal per yield
+_SITEMAP_STATIC_TPL = (
+    "  <url>\n"
+    "    <loc>https://library.davidkarpay.com/%s</loc>\n"
+    "    <priority>%s</priority>\n"
+    "    <changefreq>%s</changefreq>\n"
+    "  </url>\n"
+)
+_SITEMAP_URL_TPL = (
+    "  <url>\n"
+    "    <loc>https://library.davidkarpay.com/%s</loc>\n"
+    "    <priority>0.6</priority>\n"
+    "    <changefreq>monthly</changefreq>\n"
+    "  </url>\n"
+)
+
+
+def _iter_sitemap(entries: list, static_pages: list):
+    """Yield sitemap.xml chunks one <url> block at a time.
+
+    Feeding this generator to writelines avoids materializing the whole
+    sitemap as a list plus a joined string; %-formatting is also cheaper
+    than f-strings in this hot loop.
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+    for page, priority, changefreq in static_pages:
+        yield _SITEMAP_STATIC_TPL % (page, priority, changefreq)
+
+    for entry in entries:
+        prefix = _URL_PREFIX.get(entry.get("content_type", "video"),
+                                 "transcripts/")
+        yield _SITEMAP_URL_TPL % ("%s%s.html" % (prefix, entry["_filename"]))
+
+    yield '</urlset>\n'
+
+
+def generate_agent_files(entries: list, facet_index: dict,
+                         content_type_index: dict, env: Environment):
+    """Generate agent discovery files: robots.txt, sitemap.xml, llms.txt, ai.json.
+
+    The four outputs are independent, so their writes run concurrently
+    on a small thread pool - formatting is cheap and the time here is
+    dominated by disk I/O, which threads overlap fine under the GIL.
+    """
     from datetime import datetime
 
     total = len(entries)
@@ -2392,192 +1443,92 @@ def generate_agent_files(entries: list, facet_index: dict, content_type_index: d
     podcast_count = len(content_type_index["podcast"])
     blog_count = len(content_type_index["blog"])
     today = datetime.now().strftime("%Y-%m-%d")
-
-    # robots.txt
-    robots_txt = f"""# Learning Library - robots.txt
-# Last updated: {today}
-
-User-agent: *
-Allow: /
-
-# Agent discovery files
-# /llms.txt - AI agent guide
-# /.well-known/ai.json - API capabilities
-# /library.json - Full content index
-
-Sitemap: https://library.davidkarpay.com/sitemap.xml
-"""
-    (SITE_DIR / "robots.txt").write_text(robots_txt)
-    print("  Generated robots.txt")
-
-    # sitemap.xml
-    sitemap_entries = ['<?xml version="1.0" encoding="UTF-8"?>']
-    sitemap_entries.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-
-    # Static pages
-    static_pages = [
-        ("", "1.0", "daily"),
-        ("papers/index.html", "0.8", "daily"),
-        ("podcasts/index.html", "0.8", "daily"),
-        ("blogs/index.html", "0.8", "daily"),
-        ("channels/index.html", "0.7", "weekly"),
-    ]
-    for page, priority, changefreq in static_pages:
-        sitemap_entries.append(f"""  <url>
-    <loc>https://library.davidkarpay.com/{page}</loc>
-    <priority>{priority}</priority>
-    <changefreq>{changefreq}</changefreq>
-  </url>""")
-
-    # Content pages
-    for entry in entries:
-        content_type = entry.get("content_type", "video")
-        filename = entry.get("_filename", "")
-        if not filename:
-            continue
-
-        if content_type == "paper":
-            path = f"papers/{filename}.html"
-        elif content_type == "podcast":
-            path = f"podcasts/{filename}.html"
-        elif content_type == "blog":
-            path = f"blogs/{filename}.html"
-        else:
-            path = f"transcripts/{filename}.html"
-
-        sitemap_entries.append(f"""  <url>
-    <loc>https://library.davidkarpay.com/{path}</loc>
-    <priority>0.6</priority>
-    <changefreq>monthly</changefreq>
-  </url>""")
-
-    sitemap_entries.append('</urlset>')
-    (SITE_DIR / "sitemap.xml").write_text('\n'.join(sitemap_entries))
-    print(f"  Generated sitemap.xml ({len(entries) + len(static_pages)} URLs)")
-
-    # llms.txt - AI agent discovery guide
-    topics_list = ", ".join(sorted(facet_index["topics"].keys()))
-    llms_txt = f"""# Learning Library - AI Agent Guide
-# Last updated: {today}
-# Total items: {total}
-
-## Description
-A curated learning library containing educational content on technology, programming, AI/ML, security, and more.
-
-Content types:
-- Videos: {video_count} (YouTube transcripts with timestamps)
-- Papers: {paper_count} (Research papers with abstracts)
-- Podcasts: {podcast_count} (Audio transcripts)
-- Blogs: {blog_count} (Technical articles)
-
-Topics: {topics_list}
-
-## Quick Access
-
-Data:
-- /library.json - Complete index with all metadata ({total} items)
-- /sitemap.xml - All page URLs
-- /.well-known/ai.json - Machine-readable API capabilities
-
-## REST API
-
-Base URL: https://youtube-library-docent.dlkarpay.workers.dev
-
-Endpoints:
-- GET /api/search?q=<query>&type=video|paper|podcast|blog|all&topic=<topic>&limit=20
-- GET /api/recommend?topic=<topic>&level=beginner|intermediate|advanced&limit=10
-- GET /api/learning-path?goal=<learning_goal>
-- GET /api/whats-new?days=7&type=all
-- GET /api/content/<id>
-- GET /api/stats
-- GET /api/facets
-- POST /api/chat {{"message": "...", "context": []}}
-
-## MCP Server
-
-For Claude Desktop integration, add to claude_desktop_config.json:
-{{
-  "mcpServers": {{
-    "learning-library": {{
-      "command": "python",
-      "args": ["/path/to/mcp_docent_server.py"]
-    }}
-  }}
-}}
-
-MCP Tools: search_library, recommend_by_topic, get_learning_path, find_related_content, get_whats_new, get_content_excerpt
-
-## Schema
-
-Content entry structure:
-{{
-  "id": "unique-id",
-  "content_type": "video|paper|podcast|blog",
-  "title": "Title",
-  "url": "source-url",
-  "facets": {{
-    "topics": ["ai-ml", "security"],
-    "format": "tutorial|deep-dive|research-paper",
-    "difficulty": "beginner|intermediate|advanced"
-  }},
-  "summary": ["Key point 1", "Key point 2"],
-  "sections": [{{"title": "...", "description": "..."}}]
-}}
-
-## Rate Limits
-- API: 100 requests/minute per IP
-- For bulk access, use /library.json directly
-"""
-    (SITE_DIR / "llms.txt").write_text(llms_txt)
-    print("  Generated llms.txt")
-
-    # .well-known/ai.json
-    (SITE_DIR / ".well-known").mkdir(exist_ok=True)
-    ai_json = {
-        "version": "1.0",
-        "name": "Learning Library",
-        "description": f"Curated educational content library with {total} items",
-        "updated": today,
-        "content": {
-            "total": total,
-            "videos": video_count,
-            "papers": paper_count,
-            "podcasts": podcast_count,
-            "blogs": blog_count
-        },
-        "topics": sorted(facet_index["topics"].keys()),
-        "api": {
-            "base_url": "https://youtube-library-docent.dlkarpay.workers.dev",
-            "endpoints": [
-                {"path": "/api/search", "method": "GET", "params": ["q", "type", "topic", "difficulty", "limit"]},
-                {"path": "/api/recommend", "method": "GET", "params": ["topic", "level", "limit"]},
-                {"path": "/api/learning-path", "method": "GET", "params": ["goal"]},
-                {"path": "/api/whats-new", "method": "GET", "params": ["days", "type"]},
-                {"path": "/api/content/{id}", "method": "GET"},
-                {"path": "/api/chat", "method": "POST"}
-            ]
-        },
-        "data": {
-            "library_json": "https://library.davidkarpay.com/library.json",
-            "sitemap": "https://library.davidkarpay.com/sitemap.xml",
-            "llms_txt": "https://library.davidkarpay.com/llms.txt"
-        },
-        "mcp": {
-            "available": True,
-            "script": "mcp_docent_server.py",
-            "tools": [
-                "search_library",
-                "recommend_by_topic",
-                "get_learning_path",
-                "find_related_content",
-                "get_whats_new",
-                "get_content_excerpt"
-            ]
+    sorted_topics = sorted(facet_index["topics"])
+
+    def _write_robots():
+        _write_page(env.get_template("robots.txt.j2"), SITE_DIR / "robots.txt",
+                    today=today)
+        return "  Generated robots.txt"
+
+    def _write_sitemap():
+        # Streamed through writelines rather than joining one big list,
+        # so peak memory stays at the write buffer regardless of library
+        # size
+        static_pages = [
+            ("", "1.0", "daily"),
+            ("papers/index.html", "0.8", "daily"),
+            ("podcasts/index.html", "0.8", "daily"),
+            ("blogs/index.html", "0.8", "daily"),
+            ("channels/index.html", "0.7", "weekly"),
+        ]
+        # Filter un-publishable entries once instead of guarding per
+        # entry inside the hot sitemap loop (_filename is set on load,
+        # so this normally keeps everything)
+        publishable = [e for e in entries if e.get("_filename")]
+        with open(SITE_DIR / "sitemap.xml", "w", encoding="utf-8",
+                  buffering=1 << 20) as f:
+            f.writelines(_iter_sitemap(publishable, static_pages))
+        return f"  Generated sitemap.xml ({len(publishable) + len(static_pages)} URLs)"
+
+    def _write_llms():
+        _write_page(env.get_template("llms.txt.j2"), SITE_DIR / "llms.txt",
+                    today=today, total=total, video_count=video_count,
+                    paper_count=paper_count, podcast_count=podcast_count,
+                    blog_count=blog_count,
+                    topics_list=", ".join(sorted_topics))
+        return "  Generated llms.txt"
+
+    def _write_ai_json():
+        (SITE_DIR / ".well-known").mkdir(exist_ok=True)
+        ai_json = {
+            "version": "1.0",
+            "name": "Learning Library",
+            "description": f"Curated educational content library with {total} items",
+            "updated": today,
+            "content": {
+                "total": total,
+                "videos": video_count,
+                "papers": paper_count,
+                "podcasts": podcast_count,
+                "blogs": blog_count
+            },
+            "topics": sorted_topics,
+            "api": {
+                "base_url": "https://youtube-library-docent.dlkarpay.workers.dev",
+                "endpoints": [
+                    {"path": "/api/search", "method": "GET", "params": ["q", "type", "topic", "difficulty", "limit"]},
+                    {"path": "/api/recommend", "method": "GET", "params": ["topic", "level", "limit"]},
+                    {"path": "/api/learning-path", "method": "GET", "params": ["goal"]},
+                    {"path": "/api/whats-new", "method": "GET", "params": ["days", "type"]},
+                    {"path": "/api/content/{id}", "method": "GET"},
+                    {"path": "/api/chat", "method": "POST"}
+                ]
+            },
+            "data": {
+                "library_json": "https://library.davidkarpay.com/library.json",
+                "sitemap": "https://library.davidkarpay.com/sitemap.xml",
+                "llms_txt": "https://library.davidkarpay.com/llms.txt"
+            },
+            "mcp": {
+                "available": True,
+                "script": "mcp_docent_server.py",
+                "tools": [
+                    "search_library",
+                    "recommend_by_topic",
+                    "get_learning_path",
+                    "find_related_content",
+                    "get_whats_new",
+                    "get_content_excerpt"
+                ]
+            }
         }
-    }
-    with open(SITE_DIR / ".well-known" / "ai.json", "w") as f:
-        json.dump(ai_json, f, indent=2)
-    print("  Generated .well-known/ai.json")
+        _write_json(SITE_DIR / ".well-known" / "ai.json", ai_json)
+        return "  Generated .well-known/ai.json"
+
+    writers = (_write_robots, _write_sitemap, _write_llms, _write_ai_json)
+    with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+        for message in pool.map(lambda w: w(), writers):
+            print(message)
 
 
 if __name__ == "__main__":
@@ -26,10 +26,24 @@ Environment Variables:
     OLLAMA_MODEL - Model to use (default: llama3.1:8b)
 """
 
+import hashlib
+import json
 import os
+import threading
+from pathlib import Path
+
 import requests
 from typing import Optional
 
+# Disk cache for generate_cached: responses keyed by prompt hash so reruns
+# over unchanged content skip the LLM entirely
+CACHE_DIR = Path(__file__).parent / ".llm_cache"
+
+# Bump to invalidate every cached response (e.g. after prompt rewords)
+PROMPT_VERSION = "1"
+
+_MEMORY_CACHE_SIZE = 128
+
 
 class LLMClient:
     """Unified LLM client for local and cloud Ollama."""
@@ -48,6 +62,20 @@ class LLMClient:
         self.timeout = int(os.environ.get("OLLAMA_TIMEOUT", "120"))
         self.api_key = api_key or os.environ.get("OLLAMA_API_KEY", "")
 
+        # Persistent session keeps TCP/TLS connections to the Ollama server
+        # warm across calls instead of handshaking per request
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Small in-memory layer over the disk cache for hot keys. The
+        # lock guards eviction: generate_cached runs on several worker
+        # threads at once and two of them racing to pop the same first
+        # key would raise from an otherwise-successful call
+        self._memory_cache = {}
+        self._memory_lock = threading.Lock()
+
     def _get_headers(self) -> dict:
         """Get request headers including authentication if configured."""
         headers = {'Content-Type': 'application/json'}
@@ -77,7 +105,7 @@ class LLMClient:
             if system:
                 payload["system"] = system
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/generate",
                 headers=self._get_headers(),
                 json=payload,
@@ -96,6 +124,53 @@ class LLMClient:
             print(f"Warning: LLM request failed: {e}")
             return ""
 
+    def _remember(self, key: str, response: str):
+        """Keep a response in the bounded in-memory cache (thread-safe)."""
+        with self._memory_lock:
+            if len(self._memory_cache) >= _MEMORY_CACHE_SIZE:
+                self._memory_cache.pop(next(iter(self._memory_cache)), None)
+            self._memory_cache[key] = response
+
+    def generate_cached(self, prompt: str, system: str = None, timeout: int = None) -> str:
+        """
+        Like generate(), but with a persistent disk cache.
+
+        Intended for analysis pipelines where the prompt is a pure function
+        of the content: reruns after a crash or a post-processing change
+        get their responses from .llm_cache instead of paying the LLM
+        again. Keys include the model and PROMPT_VERSION so model swaps and
+        prompt rewrites don't serve stale responses.
+        """
+        key = hashlib.blake2b(
+            f"{PROMPT_VERSION}|{self.model}|{system or ''}|{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+
+        cached = self._memory_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cache_path = CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            try:
+                response = json.loads(cache_path.read_text())["response"]
+                self._remember(key, response)
+                return response
+            except Exception:
+                pass  # Corrupt cache entry - regenerate below
+
+        response = self.generate(prompt, system=system, timeout=timeout)
+        if response:
+            try:
+                CACHE_DIR.mkdir(exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps({"response": response}))
+                tmp_path.replace(cache_path)  # Atomic on POSIX
+            except OSError as e:
+                print(f"Warning: could not write LLM cache: {e}")
+            self._remember(key, response)
+        return response
+
     def chat(self, messages: list, system: str = None, timeout: int = None) -> str:
         """
         Multi-turn chat conversation.
@@ -116,7 +191,7 @@ class LLMClient:
                 chat_messages.append({"role": "system", "content": system})
             chat_messages.extend(messages)
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/chat",
                 headers=self._get_headers(),
                 json={
@@ -142,7 +217,7 @@ class LLMClient:
     def is_available(self) -> bool:
         """Check if the Ollama server is reachable."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/tags",
                 headers=self._get_headers(),
                 timeout=5
@@ -154,7 +229,7 @@ class LLMClient:
     def list_models(self) -> list:
         """Get list of available models on the server."""
         try:
-            response = requests.get(f"{self.url}/api/tags", timeout=10)
+            response = self.session.get(f"{self.url}/api/tags", timeout=10)
             response.raise_for_status()
             models = response.json().get("models", [])
             return [m.get("name", "") for m in models]
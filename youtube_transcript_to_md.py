@@ -24,6 +24,8 @@ from urllib.parse import urlparse, parse_qs
 import requests
 from youtube_transcript_api import YouTubeTranscriptApi
 
+from llm_client import LLMClient
+
 OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "gpt-oss:120b-cloud")
 
@@ -120,18 +122,13 @@ def format_timestamp_compact(seconds: float) -> str:
     return f"{s // 3600}:{(s % 3600) // 60:02d}:{s % 60:02d}"
 
 
+# Shared client: keeps the connection to Ollama warm and caches analysis
+# responses on disk so reprocessing unchanged transcripts is free
+_llm = LLMClient(url=OLLAMA_URL, model=OLLAMA_MODEL)
+
+
 def ollama_generate(prompt: str, timeout: int = 60) -> str:
-    try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
-            json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False},
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json().get("response", "").strip()
-    except Exception as e:
-        print(f"Warning: Ollama request failed: {e}")
-        return ""
+    return _llm.generate_cached(prompt, timeout=timeout)
 
 
 def chunk_into_sections(transcript: list, target_duration: int = 180) -> list: